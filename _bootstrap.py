@@ -0,0 +1,17 @@
+"""
+Import Path Bootstrap
+
+Importing this module puts the project root and backend/ on sys.path so the
+root-level scripts can use both 'database' and 'backend.database' style imports.
+"""
+
+import os
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(ROOT_DIR, 'backend')
+
+# Add paths to sys.path if not already there
+for path in (ROOT_DIR, BACKEND_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -1,4 +1,5 @@
 import os
+import re
 import asyncio
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -8,15 +9,34 @@ import httpx
 
 from database.database import get_db_session
 from database.models import Lead, LeadStatus, DataEntryLog
-from services.leadhoop_service import EnhancedLeadHoopService as LeadHoopService
+from services.leadhoop_service import leadhoop_service
+
+# Strips formatting from phone numbers in a single C-level pass
+_NON_DIGIT_RE = re.compile(r'\D+')
 
 class DataEntryAgent:
     """AI Data Entry Agent that automates data entry into Lead Hoop portal using pre-fill URL"""
     
     def __init__(self):
-        self.leadhoop_service = LeadHoopService()
+        self.leadhoop_service = leadhoop_service
         self._running = False
+        # Set once start() has entered its processing loop
+        self.ready = asyncio.Event()
         self.base_prefill_url = os.getenv("LEADHOOP_PREFILL_URL", "https://ieim-portal.leadhoop.com/consumer/new/aSuRzy0E8XWWKeLJngoDiQ")
+        # Shared keep-alive client for pre-fill requests, created on first use
+        self._client: Optional[httpx.AsyncClient] = None
+        
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared pre-fill client so requests reuse pooled TLS connections"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(follow_redirects=True, timeout=30.0, http2=True)
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared pre-fill client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         
     @property
     def running(self):
@@ -46,6 +66,7 @@ class DataEntryAgent:
             
             # Set running state
             self._running = True
+            self.ready.set()
             logger.info(f"Data Entry Agent started successfully (running={self._running})")
             print(f"Data Entry Agent started successfully (running={self._running})")
             
@@ -69,6 +90,7 @@ class DataEntryAgent:
             logger.error(error_msg)
             print(error_msg)
             self._running = False
+            self.ready.clear()
             logger.info(f"Data Entry Agent stopped due to error (running={self._running})")
             print(f"Data Entry Agent stopped due to error (running={self._running})")
             
@@ -78,6 +100,7 @@ class DataEntryAgent:
         """Stop the data entry agent"""
         logger.info("Data Entry Agent stop requested")
         self._running = False
+        self.ready.clear()
 
     async def _process_confirmed_leads_http(self):
         """Process leads with confirmed status using HTTP requests"""
@@ -153,59 +176,59 @@ class DataEntryAgent:
             prefill_url = self._generate_prefill_url(lead)
             logger.info(f"Generated pre-fill URL for lead {lead.id}")
             
-            # Send HTTP request to the pre-fill URL
-            async with httpx.AsyncClient(follow_redirects=True, timeout=30.0) as client:
-                # First request - load the pre-fill URL
-                logger.info(f"Sending HTTP request to pre-fill URL")
-                response = await client.get(prefill_url)
-                
-                response_info = {
-                    "status_code": response.status_code,
-                    "prefill_url_length": len(prefill_url),
-                    "response_length": len(response.content) if response.content else 0
-                }
-                
-                logger.info(f"Response info: {response_info}")
-                
-                if response.status_code != 200:
-                    logger.error(f"Failed to load pre-fill URL. Status code: {response.status_code}")
-                    if entry_log:
-                        entry_log.success = False
-                        entry_log.error_message = f"Failed to load pre-fill URL. Status code: {response.status_code}"
-                        entry_log.completed_at = datetime.utcnow()
-                    
-                    attempts = getattr(lead, 'leadhoop_entry_attempts', 0) + 1
-                    if hasattr(lead, 'leadhoop_entry_attempts'):
-                        lead.leadhoop_entry_attempts = attempts
-                    
-                    if attempts < 3:
-                        self._update_lead_status(lead, LeadStatus.CONFIRMED, db, 
-                                                error=f"Failed to load pre-fill URL. Status code: {response.status_code}")
-                    else:
-                        self._update_lead_status(lead, LeadStatus.ENTRY_FAILED, db, 
-                                                error=f"Failed to load pre-fill URL after 3 attempts")
-                    
-                    db.commit()
-                    return
-                
-                # Record the pre-fill URL in the entry log
+            # Send HTTP request to the pre-fill URL over the agent's pooled client
+            client = self._get_client()
+            # First request - load the pre-fill URL
+            logger.info(f"Sending HTTP request to pre-fill URL")
+            response = await client.get(prefill_url)
+            
+            response_info = {
+                "status_code": response.status_code,
+                "prefill_url_length": len(prefill_url),
+                "response_length": len(response.content) if response.content else 0
+            }
+            
+            logger.info(f"Response info: {response_info}")
+            
+            if response.status_code != 200:
+                logger.error(f"Failed to load pre-fill URL. Status code: {response.status_code}")
                 if entry_log:
-                    entry_log.leadhoop_response = {
-                        "status_code": response.status_code,
-                        "message": "Pre-fill URL loaded successfully"
-                    }
-                    entry_log.success = True
+                    entry_log.success = False
+                    entry_log.error_message = f"Failed to load pre-fill URL. Status code: {response.status_code}"
                     entry_log.completed_at = datetime.utcnow()
                 
-                # Update lead status to entered status
-                if hasattr(lead, 'leadhoop_entry_success'):
-                    lead.leadhoop_entry_success = True
+                attempts = getattr(lead, 'leadhoop_entry_attempts', 0) + 1
+                if hasattr(lead, 'leadhoop_entry_attempts'):
+                    lead.leadhoop_entry_attempts = attempts
                 
-                self._update_lead_status(lead, LeadStatus.ENTERED, db)
+                if attempts < 3:
+                    self._update_lead_status(lead, LeadStatus.CONFIRMED, db, 
+                                            error=f"Failed to load pre-fill URL. Status code: {response.status_code}")
+                else:
+                    self._update_lead_status(lead, LeadStatus.ENTRY_FAILED, db, 
+                                            error=f"Failed to load pre-fill URL after 3 attempts")
                 
-                logger.info(f"Successfully processed lead {lead.id}")
                 db.commit()
-                
+                return
+            
+            # Record the pre-fill URL in the entry log
+            if entry_log:
+                entry_log.leadhoop_response = {
+                    "status_code": response.status_code,
+                    "message": "Pre-fill URL loaded successfully"
+                }
+                entry_log.success = True
+                entry_log.completed_at = datetime.utcnow()
+            
+            # Update lead status to entered status
+            if hasattr(lead, 'leadhoop_entry_success'):
+                lead.leadhoop_entry_success = True
+            
+            self._update_lead_status(lead, LeadStatus.ENTERED, db)
+            
+            logger.info(f"Successfully processed lead {lead.id}")
+            db.commit()
+            
         except Exception as e:
             error_msg = f"Exception during HTTP data entry: {str(e)}"
             logger.error(f"Exception processing lead {lead.id}: {e}")
@@ -245,7 +268,7 @@ class DataEntryAgent:
                 except Exception as e:
                     logger.error(f"Error adding error message to lead: {e}")
             
-            logger.info(f"Updated lead {lead.id} status to {status}")
+            logger.info(f"Updated lead {lead.id} status to {status.value}")
         except Exception as e:
             logger.error(f"Failed to update lead status: {e}")
     
@@ -297,7 +320,7 @@ class DataEntryAgent:
             return ""
         
         # Remove all non-digit characters
-        digits = ''.join(filter(str.isdigit, phone))
+        digits = _NON_DIGIT_RE.sub('', phone)
         
         # Format as (XXX)XXX-XXXX if we have 10 digits
         if len(digits) == 10:
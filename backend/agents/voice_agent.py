@@ -8,8 +8,8 @@ from sqlalchemy.orm import Session
 
 from database.database import get_db_session
 from database.models import Lead, LeadStatus, CallLog
-from services.vapi_service import VAPIService
-from services.s3_service import S3Service
+from services.vapi_service import VAPIService, CallData, Customer, LeadData
+from services.s3_service import s3_service
 from config.call_settings import CALL_ATTEMPT_SETTINGS, MAX_CALL_DAYS, MAX_TOTAL_ATTEMPTS
 
 class VoiceAgent:
@@ -17,8 +17,10 @@ class VoiceAgent:
     
     def __init__(self):
         self.vapi_service = VAPIService()
-        self.s3_service = S3Service()
+        self.s3_service = s3_service
         self.running = False
+        # Set once start() has entered its processing loop
+        self.ready = asyncio.Event()
         self.call_statistics = {
             "total_attempts": 0,
             "successful_vapi_calls": 0,
@@ -26,10 +28,14 @@ class VoiceAgent:
             "time_restriction_blocks": 0,
             "max_attempts_reached": 0
         }
+        # (successful, total) counts the cached success rate was computed from
+        self._success_rate_counts = (0, 0)
+        self._success_rate = 0.0
         
     async def start(self):
         """Start the voice agent to process pending leads"""
         self.running = True
+        self.ready.set()
         logger.info("Voice Agent started with enhanced debugging")
         logger.info(f"Call settings: {CALL_ATTEMPT_SETTINGS}")
         
@@ -44,6 +50,7 @@ class VoiceAgent:
     def stop(self):
         """Stop the voice agent"""
         self.running = False
+        self.ready.clear()
         logger.info(f"Voice Agent stopped. Statistics: {self.call_statistics}")
     
     async def _process_pending_leads(self):
@@ -172,7 +179,7 @@ class VoiceAgent:
             return
             
         # Check if this is a valid time to call
-        is_valid_time = await self.vapi_service.is_valid_call_time(lead.phone1)
+        is_valid_time = self.vapi_service.is_valid_call_time(lead.phone1)
         if not is_valid_time:
             error_msg = f"Outside of allowed calling hours"
             logger.warning(f"Lead {lead.id}: {error_msg}")
@@ -190,22 +197,11 @@ class VoiceAgent:
         logger.info(f"Lead {lead.id}: Phone formatted from '{lead.phone1}' to '{formatted_phone}'")
         
         # Prepare call data
-        call_data = {
-            "assistant_id": self.vapi_service.assistant_id,
-            "customer": {
-                "number": formatted_phone
-            },
-            "lead_data": {
-                "first_name": lead.first_name or "",
-                "last_name": lead.last_name or "",
-                "email": lead.email or "",
-                "phone": lead.phone1 or "",
-                "address": lead.address or "",
-                "city": lead.city or "",
-                "state": lead.state or "",
-                "zip_code": lead.zip_code or ""
-            }
-        }
+        call_data = CallData(
+            assistant_id=self.vapi_service.assistant_id,
+            customer=Customer(number=formatted_phone),
+            lead_data=LeadData.from_lead(lead)
+        )
         
         logger.info(f"Lead {lead.id}: Prepared call data: {call_data}")
         
@@ -538,19 +534,18 @@ class VoiceAgent:
                 "error": error
             })
             
-        logger.info(f"Lead {lead.id}: Status updated from {old_status} to {status}")
+        logger.info(f"Lead {lead.id}: Status updated from {old_status.value if old_status else None} to {status.value}")
         if error:
             logger.error(f"Lead {lead.id}: Error - {error}")
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get current call statistics"""
-        return {
-            **self.call_statistics,
-            "success_rate": (
-                self.call_statistics["successful_vapi_calls"] / 
-                max(self.call_statistics["total_attempts"], 1) * 100
-            )
-        }
+        # Recompute the success rate only after the call counters move
+        counts = (self.call_statistics["successful_vapi_calls"], self.call_statistics["total_attempts"])
+        if counts != self._success_rate_counts:
+            self._success_rate_counts = counts
+            self._success_rate = counts[0] / max(counts[1], 1) * 100
+        return {**self.call_statistics, "success_rate": self._success_rate}
 
 # Singleton instance
 voice_agent = VoiceAgent() 
\ No newline at end of file
@@ -0,0 +1,88 @@
+import asyncio
+from typing import Dict, Any, List, Optional, Set
+from loguru import logger
+from sqlalchemy import insert
+
+from database.database import get_db_session
+from database.models import CallLog
+
+class CallLogWriter:
+    """Buffers CallLog rows and writes them with one executemany INSERT per batch"""
+
+    def __init__(self, batch_size: int = 50, flush_interval: float = 0.5, max_retries: int = 3):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_retries = max_retries
+        self._pending: List[Dict[str, Any]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        # Strong references to scheduled flushes; the loop only keeps weak ones
+        self._tasks: Set[asyncio.Task] = set()
+        # Failed flushes in a row; the queued rows are dropped once this reaches max_retries
+        self._failures = 0
+
+    def enqueue(self, row: Dict[str, Any]):
+        """Queue a CallLog row; it is written once the batch fills or the interval elapses"""
+        self._pending.append(row)
+        if len(self._pending) >= self.batch_size:
+            self._spawn(self.flush())
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = self._spawn(self._flush_later())
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """Schedule a flush coroutine and hold on to it until it finishes"""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _flush_later(self):
+        await asyncio.sleep(self.flush_interval)
+        await self.flush()
+
+    def _write(self, batch: List[Dict[str, Any]]):
+        """Insert a batch in a single round-trip and commit once (runs in a worker thread)"""
+        db = get_db_session()
+        try:
+            db.execute(insert(CallLog), batch)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    async def flush(self) -> int:
+        """Write all queued rows off the event loop; failed rows are requeued for a retry"""
+        if not self._pending:
+            return 0
+
+        batch, self._pending = self._pending, []
+        try:
+            await asyncio.to_thread(self._write, batch)
+        except Exception as e:
+            self._failures += 1
+            if self._failures >= self.max_retries:
+                logger.error(f"Dropping {len(batch)} call logs after {self._failures} failed flushes: {e}")
+                self._failures = 0
+                return 0
+
+            logger.warning(f"Failed to flush {len(batch)} call logs (attempt {self._failures}), retrying: {e}")
+            self._pending[:0] = batch
+            # This may be running inside the current timer task, so always start a new one
+            self._flush_task = self._spawn(self._flush_later())
+            return 0
+
+        self._failures = 0
+        logger.debug(f"Flushed {len(batch)} call logs")
+        return len(batch)
+
+    async def close(self) -> int:
+        """Wait for scheduled and in-flight flushes, then write whatever is still queued"""
+        current = asyncio.current_task()
+        tasks = [task for task in self._tasks if task is not current]
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return await self.flush()
+
+# Shared writer for API handlers
+call_log_writer = CallLogWriter()
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, Date
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, Date, Index, Enum as SQLEnum
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.sql import func
 from enum import Enum
@@ -16,8 +16,21 @@ class LeadStatus(str, Enum):
     ENTERED = "entered"
     ENTRY_FAILED = "entry_failed"
 
+# Native Postgres ENUM (4-byte OID) storing the same lowercase values as before,
+# so API payloads and string comparisons are unchanged
+lead_status_type = SQLEnum(
+    LeadStatus,
+    name="lead_status",
+    values_callable=lambda statuses: [status.value for status in statuses]
+)
+
 class Lead(Base):
     __tablename__ = "leads"
+    __table_args__ = (
+        # Covering index for the status filters/GROUP BYs in stats, reset and agent
+        # queries: id and updated_at are read from index leaf pages, not the wide row
+        Index("ix_leads_status_covering", "status", postgresql_include=["id", "updated_at"]),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     
@@ -54,7 +67,7 @@ class Lead(Base):
     enrollment_status = Column(String(100))
     
     # Lead processing status
-    status = Column(String(50), default=LeadStatus.PENDING, index=True)
+    status = Column(lead_status_type, default=LeadStatus.PENDING)  # indexed by ix_leads_status_covering
     
     # Voice agent collected/confirmed data
     confirmed_email = Column(String(255))
@@ -85,7 +98,7 @@ class Lead(Base):
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
     
     def __repr__(self):
-        return f"<Lead(id={self.id}, phone={self.phone1}, status={self.status})>"
+        return f"<Lead(id={self.id}, phone={self.phone1}, status={self.status.value if self.status else None})>"
 
 class CallLog(Base):
     __tablename__ = "call_logs"
@@ -250,7 +250,7 @@ async def test_sample_lead():
             print(f"   Formatted phone: {formatted_phone}")
             
             # Test call time validation
-            is_valid_time = await vapi_service.is_valid_call_time(pending_lead.phone1)
+            is_valid_time = vapi_service.is_valid_call_time(pending_lead.phone1)
             print(f"   Valid call time: {is_valid_time}")
         
         # Test call attempt validation (simulate)
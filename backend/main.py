@@ -12,32 +12,39 @@ if current_dir not in sys.path:
 if backend_dir not in sys.path:
     sys.path.insert(0, backend_dir)
 
-from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, BackgroundTasks
+from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, BackgroundTasks, Query, Header
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict, Any
 import pandas as pd
 import asyncio
 import os
 import json
+import secrets
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pydantic import BaseModel
 
 from database.database import get_db, create_tables
 from database.models import Lead, LeadStatus, CallLog, DataEntryLog
+from database.call_log_writer import call_log_writer
 from agents.voice_agent import voice_agent
 from agents.data_entry_agent import DataEntryAgent
-from services.vapi_service import VAPIService
-from services.s3_service import S3Service
+from services.vapi_service import CallData, Customer, LeadData
+from services.s3_service import s3_service, S3_CLIENT_CONFIG
 from schemas import LeadCreate, LeadResponse, LeadUpdate, CallLogResponse, DataEntryLogResponse
 from config.call_settings import CALL_ATTEMPT_SETTINGS, MAX_CALL_DAYS, MAX_TOTAL_ATTEMPTS
+from reset_leads import reset_all_leads, RESET_BATCH_SIZE, MAX_RESET_BATCH_SIZE
 
 # Initialize FastAPI app
 app = FastAPI(
     title="MERGE AI Multi-Agent Workflow",
     description="Multi-agent AI system for lead processing with voice calls and data entry automation",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # orjson serializes large lead lists much faster than stdlib json
 )
 
 # CORS middleware
@@ -57,7 +64,7 @@ data_entry_agent = DataEntryAgent()
 
 # Add this class for status update validation
 class StatusUpdate(BaseModel):
-    status: str
+    status: LeadStatus
 
 # Add this new class for call settings
 class CallAttemptsSettings(BaseModel):
@@ -78,10 +85,16 @@ async def startup_event():
     global agents_running
     create_tables()
     
+    # asyncio.to_thread runs blocking boto3 calls here; size it to the S3 connection pool
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=S3_CLIENT_CONFIG.max_pool_connections)
+    )
+    
     # Verify services
     try:
-        s3_service = S3Service()
-        s3_service.verify_bucket_access()
+        s3_status = await s3_service.test_connection()
+        if not s3_status["success"]:
+            print(f"Warning: S3 service initialization failed: {s3_status['error']}")
     except Exception as e:
         print(f"Warning: S3 service initialization failed: {e}")
     
@@ -106,6 +119,13 @@ async def shutdown_event():
     if agents_running:
         voice_agent.stop()
         data_entry_agent.stop()
+    
+    # Write any call logs still waiting for a batch flush
+    await call_log_writer.close()
+    
+    # Close pooled HTTP connections
+    await voice_agent.vapi_service.aclose()
+    await data_entry_agent.aclose()
 
 # Health check endpoint
 @app.get("/health")
@@ -126,13 +146,16 @@ async def create_lead(lead: LeadCreate, db: Session = Depends(get_db)):
     db.refresh(db_lead)
     return db_lead
 
+# Strips formatting from phone numbers in a single C-level pass
+_NON_DIGIT_RE = re.compile(r'\D+')
+
 # Define the format_phone function at module level for reuse
 def format_phone(phone_str):
     if not phone_str:
         return None
     
     # Remove all non-digit characters
-    digits_only = re.sub(r'\D', '', str(phone_str))
+    digits_only = _NON_DIGIT_RE.sub('', str(phone_str))
     
     # Debug: Print the raw digits
     print(f"Formatting phone: Raw digits: '{digits_only}'")
@@ -164,11 +187,34 @@ def format_phone(phone_str):
             return f"1{digits_only[-10:]}"
         return f"1{digits_only}"
 
+def format_phone_series(phones: pd.Series) -> pd.Series:
+    """Vectorized format_phone for a whole CSV column"""
+    digits = phones.astype("string").fillna("").str.replace(r'\D', '', regex=True)
+    lengths = digits.str.len()
+    
+    # 11-digit numbers ending in 0 are usually a float-parsed 10-digit number
+    digits = digits.where(~((lengths == 11) & digits.str.endswith('0')), digits.str[:-1])
+    lengths = digits.str.len()
+    
+    formatted = ("1" + digits).where(~((lengths == 11) & digits.str.startswith('1')), digits)
+    formatted = formatted.where(lengths <= 11, "1" + digits.str[-10:])
+    has_phone = phones.astype("string").fillna("").str.strip() != ""
+    return formatted.where(has_phone, None)
+
+# Lead columns imported as stripped text; phone and dates are parsed separately
+_IMPORT_TEXT_COLUMNS = (
+    'first_name', 'last_name', 'email', 'test', 'address', 'address2', 'city',
+    'state', 'zip_code', 'gender', 'ip', 'subid2', 'signup_url', 'consent_url',
+    'education', 'grad_year', 'military_type', 'campus_type', 'area_of_study',
+    'level_of_interest', 'computer_usage', 'us_citizen', 'registered_to_vote',
+    'teaching_interest', 'enrollment_status'
+)
+
 @app.get("/leads/", response_model=List[LeadResponse])
 async def get_leads(
     skip: int = 0, 
     limit: int = 10000,  # Increased from 100 to 10000 to show all leads
-    status: Optional[str] = None,
+    status: Optional[LeadStatus] = None,
     db: Session = Depends(get_db)
 ):
     """Get leads with optional filtering"""
@@ -248,29 +294,28 @@ async def update_lead_status(lead_id: int, status_update: StatusUpdate, db: Sess
     print(f"Status update endpoint called for lead ID: {lead_id}")
     print(f"Received status_update data: {status_update.dict()}")
     
-    lead = db.query(Lead).filter(Lead.id == lead_id).first()
-    if not lead:
-        print(f"Lead not found with ID: {lead_id}")
-        raise HTTPException(status_code=404, detail="Lead not found")
-    
-    print(f"Found lead: {lead.id}, current status: {lead.status}")
-    
     # Get new status value
     new_status = status_update.status
-    print(f"Setting new status: {new_status}")
-    
-    lead.status = new_status
-    lead.updated_at = datetime.utcnow()
+    print(f"Setting new status: {new_status.value}")
     
+    # Single UPDATE; rowcount tells us whether the lead exists
     try:
+        result = db.execute(
+            update(Lead).where(Lead.id == lead_id).values(status=new_status, updated_at=datetime.utcnow())
+        )
+        if result.rowcount == 0:
+            print(f"Lead not found with ID: {lead_id}")
+            raise HTTPException(status_code=404, detail="Lead not found")
         db.commit()
-        print(f"Database commit successful, status updated to: {lead.status}")
+        print(f"Database commit successful, status updated to: {new_status.value}")
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error during database commit: {str(e)}")
         db.rollback()
         raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
     
-    return {"message": "Status updated successfully", "status": lead.status}
+    return {"message": "Status updated successfully", "status": new_status}
 
 # CSV import endpoint
 @app.post("/leads/import-csv/")
@@ -319,67 +364,30 @@ async def import_leads_from_csv(file: UploadFile = File(...), db: Session = Depe
         # Rename columns
         df = df.rename(columns=column_mapping)
         
-        # Helper function to parse dates safely
-        def parse_date(date_str):
-            if pd.isna(date_str) or date_str == '' or date_str is None:
-                return None
-            try:
-                return pd.to_datetime(date_str).date()
-            except:
-                return None
+        # Normalize every column at once with pandas string ops instead of per-row Python
+        df = df.reindex(columns=list(_IMPORT_TEXT_COLUMNS) + ["phone1", "dob", "start_date"])
+        cleaned = df[list(_IMPORT_TEXT_COLUMNS)].astype("string").apply(lambda col: col.str.strip())
+        cleaned = cleaned.replace({"": pd.NA, "nan": pd.NA})
+        cleaned["phone1"] = format_phone_series(df["phone1"])
+        for date_column in ("dob", "start_date"):
+            parsed = pd.to_datetime(df[date_column], errors="coerce", format="mixed")
+            cleaned[date_column] = parsed.dt.date.where(parsed.notna(), None)
+        
+        records = cleaned.astype(object).where(cleaned.notna(), None).to_dict("records")
         
         # Create leads
         leads_created = 0
         errors = []
         
-        for index, row in df.iterrows():
+        for index, lead_data in enumerate(records):
             try:
-                lead_data = {
-                    # Basic contact information
-                    'first_name': str(row.get('first_name', '')).strip() if pd.notna(row.get('first_name')) else None,
-                    'last_name': str(row.get('last_name', '')).strip() if pd.notna(row.get('last_name')) else None,
-                    'email': str(row.get('email', '')).strip() if pd.notna(row.get('email')) else None,
-                    'phone1': format_phone(row.get('phone1')),
-                    'test': str(row.get('test', '')).strip() if pd.notna(row.get('test')) else None,
-                    'address': str(row.get('address', '')).strip() if pd.notna(row.get('address')) else None,
-                    'address2': str(row.get('address2', '')).strip() if pd.notna(row.get('address2')) else None,
-                    'city': str(row.get('city', '')).strip() if pd.notna(row.get('city')) else None,
-                    'state': str(row.get('state', '')).strip() if pd.notna(row.get('state')) else None,
-                    'zip_code': str(row.get('zip_code', '')).strip() if pd.notna(row.get('zip_code')) else None,
-                    'gender': str(row.get('gender', '')).strip() if pd.notna(row.get('gender')) else None,
-                    'dob': parse_date(row.get('dob')),
-                    'ip': str(row.get('ip', '')).strip() if pd.notna(row.get('ip')) else None,
-                    
-                    # Additional CSV fields
-                    'subid2': str(row.get('subid2', '')).strip() if pd.notna(row.get('subid2')) else None,
-                    'signup_url': str(row.get('signup_url', '')).strip() if pd.notna(row.get('signup_url')) else None,
-                    'consent_url': str(row.get('consent_url', '')).strip() if pd.notna(row.get('consent_url')) else None,
-                    'education': str(row.get('education', '')).strip() if pd.notna(row.get('education')) else None,
-                    'grad_year': str(row.get('grad_year', '')).strip() if pd.notna(row.get('grad_year')) else None,
-                    'start_date': parse_date(row.get('start_date')),
-                    'military_type': str(row.get('military_type', '')).strip() if pd.notna(row.get('military_type')) else None,
-                    'campus_type': str(row.get('campus_type', '')).strip() if pd.notna(row.get('campus_type')) else None,
-                    'area_of_study': str(row.get('area_of_study', '')).strip() if pd.notna(row.get('area_of_study')) else None,
-                    'level_of_interest': str(row.get('level_of_interest', '')).strip() if pd.notna(row.get('level_of_interest')) else None,
-                    'computer_usage': str(row.get('computer_usage', '')).strip() if pd.notna(row.get('computer_usage')) else None,
-                    'us_citizen': str(row.get('us_citizen', '')).strip() if pd.notna(row.get('us_citizen')) else None,
-                    'registered_to_vote': str(row.get('registered_to_vote', '')).strip() if pd.notna(row.get('registered_to_vote')) else None,
-                    'teaching_interest': str(row.get('teaching_interest', '')).strip() if pd.notna(row.get('teaching_interest')) else None,
-                    'enrollment_status': str(row.get('enrollment_status', '')).strip() if pd.notna(row.get('enrollment_status')) else None,
-                    
-                    # Processing status
-                    'status': LeadStatus.PENDING
-                }
-                
                 # Skip if missing critical fields (phone is most important for calling)
-                if not lead_data['phone1'] or lead_data['phone1'] == '':
+                if not lead_data['phone1']:
                     errors.append(f"Row {index + 1}: Missing phone number")
                     continue
                 
-                # Clean empty strings to None for optional fields
-                for key, value in lead_data.items():
-                    if value == '' or value == 'nan':
-                        lead_data[key] = None
+                # Processing status
+                lead_data['status'] = LeadStatus.PENDING
                 
                 db_lead = Lead(**lead_data)
                 db.add(db_lead)
@@ -615,6 +623,36 @@ async def mark_lead_confirmed(lead_id: int, db: Session = Depends(get_db)):
     
     return {"message": f"Lead {lead_id} manually marked as confirmed"}
 
+def require_admin_key(x_admin_key: Optional[str] = Header(None)):
+    """Allow admin routes only with the X-Admin-Key header matching ADMIN_API_KEY"""
+    admin_key = os.getenv("ADMIN_API_KEY")
+    if not admin_key:
+        # No key configured: admin routes don't exist
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_key or not secrets.compare_digest(x_admin_key, admin_key):
+        raise HTTPException(status_code=403, detail="Invalid admin key")
+
+@app.post("/admin/reset-leads", dependencies=[Depends(require_admin_key)])
+def admin_reset_leads(
+    batch_size: int = Query(RESET_BATCH_SIZE, ge=1, le=MAX_RESET_BATCH_SIZE),
+    db: Session = Depends(get_db)
+):
+    """Reset all leads to pending and clear call logs (same as reset_leads.py option 2)"""
+    # A plain def, so FastAPI runs the long batched reset in its threadpool, off the event loop
+    try:
+        deleted_logs = db.query(CallLog).delete(synchronize_session=False)
+        db.commit()
+        updated_leads = reset_all_leads(db, batch_size)
+    except Exception as e:
+        db.rollback()
+        raise HTTPException(status_code=500, detail=f"Database error: {str(e)}")
+    
+    return {
+        "message": f"Reset {updated_leads} leads to pending",
+        "updated_leads": updated_leads,
+        "deleted_call_logs": deleted_logs
+    }
+
 # VAPI webhook endpoint
 @app.post("/webhooks/vapi")
 async def vapi_webhook(webhook_data: dict, db: Session = Depends(get_db)):
@@ -733,23 +771,23 @@ async def force_next_step(lead_id: int, db: Session = Depends(get_db)):
     return {"message": message, "lead_id": lead_id, "status": lead.status}
 
 @app.post("/test/set-status/{lead_id}")
-async def set_lead_status(lead_id: int, status: str, db: Session = Depends(get_db)):
+async def set_lead_status(lead_id: int, status: LeadStatus, db: Session = Depends(get_db)):
     """Manually set a lead's status (for testing)"""
-    lead = db.query(Lead).filter(Lead.id == lead_id).first()
-    if not lead:
-        raise HTTPException(status_code=404, detail="Lead not found")
+    values = {"status": status, "updated_at": datetime.utcnow()}
+    if status == LeadStatus.CONFIRMED:
+        values["tcpa_opt_in"] = True
     
     try:
-        lead.status = status
-        lead.updated_at = datetime.utcnow()
-        
-        if status == LeadStatus.CONFIRMED:
-            lead.tcpa_opt_in = True
-        
-        db.commit()
-        return {"message": f"Lead status set to {status}", "lead_id": lead_id}
+        result = db.execute(update(Lead).where(Lead.id == lead_id).values(**values))
     except Exception as e:
+        db.rollback()
         raise HTTPException(status_code=400, detail=f"Invalid status: {str(e)}")
+    
+    if result.rowcount == 0:
+        raise HTTPException(status_code=404, detail="Lead not found")
+    
+    db.commit()
+    return {"message": f"Lead status set to {status.value}", "lead_id": lead_id}
 
 @app.post("/test/make-call")
 async def test_make_call(phone_number: str, db: Session = Depends(get_db)):
@@ -773,32 +811,21 @@ async def test_make_call(phone_number: str, db: Session = Depends(get_db)):
         db.add(test_lead)
         db.commit()
         
-        # Create VAPI service
-        vapi_service = VAPIService()
+        # Reuse the agent's VAPI service and its pooled connections
+        vapi_service = voice_agent.vapi_service
         
         # Format phone number
         formatted_phone = vapi_service._format_phone_number(formatted_phone_number)
         
         # Check call time restrictions
-        is_valid_time = await vapi_service.is_valid_call_time(formatted_phone_number)
+        is_valid_time = vapi_service.is_valid_call_time(formatted_phone_number)
         
         # Prepare call data
-        call_data = {
-            "assistant_id": vapi_service.assistant_id,
-            "customer": {
-                "number": formatted_phone
-            },
-            "lead_data": {
-                "first_name": "Test",
-                "last_name": "User",
-                "email": "test@example.com",
-                "phone": formatted_phone_number,
-                "address": "123 Test St",
-                "city": "Test City",
-                "state": "TX",
-                "zip_code": "12345"
-            }
-        }
+        call_data = CallData(
+            assistant_id=vapi_service.assistant_id,
+            customer=Customer(number=formatted_phone),
+            lead_data=LeadData.from_lead(test_lead)
+        )
         
         # Log the info
         print(f"Making test call to {phone_number}")
@@ -825,17 +852,17 @@ async def test_make_call(phone_number: str, db: Session = Depends(get_db)):
             test_lead.call_started_at = datetime.utcnow()
             test_lead.status = LeadStatus.CALLING
             
-            # Log the call
-            call_log = CallLog(
-                lead_id=test_lead.id,
-                call_sid=call_result.get("call_id"),
-                phone_number=formatted_phone_number,
-                call_status="initiated",
-                vapi_call_data=call_result,
-                started_at=datetime.utcnow()
-            )
-            db.add(call_log)
             db.commit()
+            
+            # Log the call (batched with other call logs into one INSERT)
+            call_log_writer.enqueue({
+                "lead_id": test_lead.id,
+                "call_sid": call_result.get("call_id"),
+                "phone_number": formatted_phone_number,
+                "call_status": "initiated",
+                "vapi_call_data": call_result,
+                "started_at": datetime.utcnow()
+            })
         
         return {
             "success": call_result.get("success", False),
@@ -895,16 +922,37 @@ async def test_data_entry_agent():
 
 # Add these new endpoints
 
+# Parsed custom_call_settings.json, keyed by the file's mtime so repeat GETs skip the disk read
+_SETTINGS_CACHE = {"mtime": 0, "data": None}
+_SETTINGS_CACHE_LOCK = threading.Lock()
+
+def _read_custom_call_settings(settings_path: str) -> Optional[Dict[str, Any]]:
+    """Return the custom call settings, re-parsing the file only when it changed"""
+    try:
+        mtime = os.stat(settings_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+    
+    with _SETTINGS_CACHE_LOCK:
+        if _SETTINGS_CACHE["data"] is not None and _SETTINGS_CACHE["mtime"] == mtime:
+            return _SETTINGS_CACHE["data"]
+        
+        with open(settings_path, "r") as f:
+            custom_settings = json.load(f)
+        
+        _SETTINGS_CACHE["mtime"] = mtime
+        _SETTINGS_CACHE["data"] = custom_settings
+        return custom_settings
+
 @app.get("/settings/call-attempts")
 async def get_call_attempts_settings():
     """Get the current call attempts settings"""
     try:
         # First check if a custom settings file exists
         settings_path = os.path.join(backend_dir, "config", "custom_call_settings.json")
-        if os.path.exists(settings_path):
-            with open(settings_path, "r") as f:
-                custom_settings = json.load(f)
-                return custom_settings
+        custom_settings = _read_custom_call_settings(settings_path)
+        if custom_settings is not None:
+            return custom_settings
         
         # If no custom settings, return the default from call_settings.py
         return {
@@ -930,21 +978,15 @@ async def save_call_attempts_settings(settings: CallAttemptsSettings):
         # Save custom settings to JSON file
         settings_path = os.path.join(backend_dir, "config", "custom_call_settings.json")
         
-        # Convert to dict for saving
-        settings_dict = settings.dict()
-        
-        # Also update the actual call settings in memory
-        from config.call_settings import CALL_ATTEMPT_SETTINGS
-        CALL_ATTEMPT_SETTINGS[1]["max_attempts"] = settings.day1
-        CALL_ATTEMPT_SETTINGS[2]["max_attempts"] = settings.day2
-        CALL_ATTEMPT_SETTINGS[3]["max_attempts"] = settings.day3
-        CALL_ATTEMPT_SETTINGS[4]["max_attempts"] = settings.day4
-        CALL_ATTEMPT_SETTINGS[5]["max_attempts"] = settings.day5
-        CALL_ATTEMPT_SETTINGS[6]["max_attempts"] = settings.day6
+        # Also update the actual call settings in memory (only days the schedule defines)
+        days = (settings.day1, settings.day2, settings.day3, settings.day4, settings.day5, settings.day6)
+        for day, max_attempts in enumerate(days, 1):
+            if day in CALL_ATTEMPT_SETTINGS:
+                CALL_ATTEMPT_SETTINGS[day]["max_attempts"] = max_attempts
         
         # Save to file
         with open(settings_path, "w") as f:
-            json.dump(settings_dict, f, indent=2)
+            f.write(settings.model_dump_json(indent=2))
             
         return {"message": "Call attempt settings saved successfully"}
     except Exception as e:
@@ -952,4 +994,13 @@ async def save_call_attempts_settings(settings: CallAttemptsSettings):
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # "auto" picks uvloop/httptools when installed. Each worker runs its own agents,
+    # so keep WEB_CONCURRENCY at 1 unless the agents are started separately.
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1"))
+    )
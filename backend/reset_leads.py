@@ -5,6 +5,7 @@ This script resets all leads to pending status and clears call logs for fresh te
 """
 import os
 import sys
+import argparse
 from datetime import datetime
 
 # Add backend to path
@@ -13,7 +14,66 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from database.database import get_db_session
 from database.models import Lead, CallLog, LeadStatus
 
-def reset_leads_to_pending():
+# Leads reset per transaction, so a full reset never holds one long table-wide lock
+RESET_BATCH_SIZE = 10000
+MAX_RESET_BATCH_SIZE = 100000
+
+def _batch_size(value: str) -> int:
+    """argparse type for --batch-size: 1..MAX_RESET_BATCH_SIZE"""
+    size = int(value)
+    if not 1 <= size <= MAX_RESET_BATCH_SIZE:
+        raise argparse.ArgumentTypeError(f"must be between 1 and {MAX_RESET_BATCH_SIZE}")
+    return size
+
+def _reset_values() -> dict:
+    """Column values applied to every lead by a full reset"""
+    return {
+        # Reset status
+        Lead.status: LeadStatus.PENDING,
+        
+        # Clear call-related fields
+        Lead.call_sid: None,
+        Lead.call_started_at: None,
+        Lead.call_ended_at: None,
+        Lead.call_duration: None,
+        Lead.call_recording_url: None,
+        
+        # Clear confirmed data fields
+        Lead.confirmed_email: None,
+        Lead.confirmed_phone: None,
+        Lead.confirmed_address: None,
+        Lead.tcpa_opt_in: False,
+        Lead.area_of_interest: None,
+        
+        # Clear error messages
+        Lead.error_messages: None,
+        
+        # Update timestamp
+        Lead.updated_at: datetime.utcnow()
+    }
+
+def reset_all_leads(db, batch_size: int = RESET_BATCH_SIZE) -> int:
+    """Reset every lead to PENDING, committing after each batch of batch_size leads"""
+    values = _reset_values()
+    updated_leads = 0
+    last_id = 0
+    
+    while True:
+        # Walk the primary key so each batch is one short UPDATE transaction
+        batch_ids = [row.id for row in db.query(Lead.id).filter(Lead.id > last_id)
+                     .order_by(Lead.id).limit(batch_size)]
+        if not batch_ids:
+            break
+        
+        updated_leads += db.query(Lead).filter(Lead.id.in_(batch_ids)).update(
+            values, synchronize_session=False
+        )
+        db.commit()
+        last_id = batch_ids[-1]
+    
+    return updated_leads
+
+def reset_leads_to_pending(batch_size: int = RESET_BATCH_SIZE):
     """Reset all leads to pending status and clear call logs"""
     print("🔄 Resetting all leads to PENDING status...")
     
@@ -54,36 +114,9 @@ def reset_leads_to_pending():
             deleted_logs = db.query(CallLog).delete()
             print(f"🗑️  Deleted {deleted_logs} call logs")
         
-        # Reset all leads to pending
-        updated_leads = 0
-        for lead in db.query(Lead).all():
-            # Reset status
-            lead.status = LeadStatus.PENDING
-            
-            # Clear call-related fields
-            lead.call_sid = None
-            lead.call_started_at = None
-            lead.call_ended_at = None
-            lead.call_duration = None
-            lead.call_recording_url = None
-            
-            # Clear confirmed data fields
-            lead.confirmed_email = None
-            lead.confirmed_phone = None
-            lead.confirmed_address = None
-            lead.tcpa_opt_in = False
-            lead.area_of_interest = None
-            
-            # Clear error messages
-            lead.error_messages = None
-            
-            # Update timestamp
-            lead.updated_at = datetime.utcnow()
-            
-            updated_leads += 1
-        
-        # Commit changes
+        # Commit the log deletion, then reset leads in committed batches
         db.commit()
+        updated_leads = reset_all_leads(db, batch_size)
         
         print(f"✅ Successfully reset {updated_leads} leads to PENDING status")
         print(f"✅ System is ready for fresh call processing")
@@ -116,28 +149,27 @@ def reset_specific_status_leads(from_status: LeadStatus, to_status: LeadStatus =
     
     db = get_db_session()
     try:
-        # Get leads with specific status
-        leads_to_reset = db.query(Lead).filter(Lead.status == from_status).all()
+        # Count leads with specific status (no row data is fetched)
+        leads_to_reset = db.query(Lead).filter(Lead.status == from_status).count()
         
         if not leads_to_reset:
             print(f"📊 No leads found with status {from_status.value}")
             return True
         
-        print(f"📊 Found {len(leads_to_reset)} leads with status {from_status.value}")
+        print(f"📊 Found {leads_to_reset} leads with status {from_status.value}")
         
         # Confirm reset
-        confirm = input(f"\nReset {len(leads_to_reset)} leads from {from_status.value} to {to_status.value}? (yes/no): ").lower().strip()
+        confirm = input(f"\nReset {leads_to_reset} leads from {from_status.value} to {to_status.value}? (yes/no): ").lower().strip()
         
         if confirm not in ['yes', 'y']:
             print("❌ Reset cancelled.")
             return False
         
-        # Reset leads
-        updated_count = 0
-        for lead in leads_to_reset:
-            lead.status = to_status
-            lead.updated_at = datetime.utcnow()
-            updated_count += 1
+        # Reset leads with one UPDATE instead of loading and mutating each row
+        updated_count = db.query(Lead).filter(Lead.status == from_status).update({
+            Lead.status: to_status,
+            Lead.updated_at: datetime.utcnow()
+        }, synchronize_session=False)
         
         db.commit()
         
@@ -177,6 +209,11 @@ def show_lead_stats():
 
 def main():
     """Main function with menu options"""
+    parser = argparse.ArgumentParser(description="Lead Reset Utility")
+    parser.add_argument("--batch-size", type=_batch_size, default=RESET_BATCH_SIZE,
+                        help="Leads updated per transaction during a full reset")
+    args = parser.parse_args()
+    
     print("🔧 Lead Reset Utility")
     print("=" * 30)
     
@@ -194,7 +231,7 @@ def main():
         if choice == "1":
             show_lead_stats()
         elif choice == "2":
-            reset_leads_to_pending()
+            reset_leads_to_pending(args.batch_size)
         elif choice == "3":
             reset_specific_status_leads(LeadStatus.CALL_FAILED, LeadStatus.PENDING)
         elif choice == "4":
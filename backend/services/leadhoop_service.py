@@ -1,32 +1,384 @@
 import os
 import csv
 import re
+import sys
 import time
-from typing import Dict, Any, Optional, List
+import signal
+import itertools
+import multiprocessing
+import multiprocessing.util
+from datetime import date
+from typing import Dict, Any, Optional, List, Tuple, ClassVar, Pattern, Iterator
 from loguru import logger
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+
+try:
+    import polars as pl
+except ImportError:  # iter_csv_leads falls back to csv.DictReader
+    pl = None
+
+# Strips formatting from phone numbers in a single C-level pass
+_NON_DIGIT_RE = re.compile(r'\D+')
+
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+# NANP number (area and exchange codes start with 2-9) with optional leading
+# country code -> (XXX) XXX-XXXX
+_PHONE_RE = re.compile(r'^1?([2-9]\d{2})([2-9]\d{2})(\d{4})$')
+_PHONE_FMT = r'(\1) \2-\3'
+
+_REQUIRED_FIELDS = ("first_name", "last_name", "email", "phone")
+
+# MM/DD/YYYY date of birth, parsed straight to ints
+_DOB_RE = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
+
+# Placeholder numbers that show up in test and junk leads
+_PLACEHOLDER_PHONES = frozenset({"1234567890", "0000000000"})
+
+# Per-field normalization applied by format_lead_data_for_entry
+_FORMAT_OPS = {
+    "first_name": str.title,
+    "last_name": str.title,
+    "email": str.lower,
+    "city": str.title,
+    "state": str.upper,
+    "zip_code": str,
+    "education_level": str,
+    "area_of_study": str,
+    "level_of_interest": str,
+    "military_type": str,
+    "campus_type": str,
+}
+
+# Yes/No CSV answers submitted as checkboxes
+_BOOL_FIELDS = ("us_citizen", "registered_nurse", "teaching_license", "computer_internet")
+
+# Answers treated as "yes", in the casings CSV exports use (no lower() copy needed)
+_YES_VALUES = frozenset({"yes", "Yes", "YES", "y", "Y", "true", "True", "TRUE", "1"})
+
+# Lead CSV header -> standardized lead key (tcpa_opt_in is always set to True)
+CSV_TO_LEAD_MAP = {
+    "Firstname": "first_name",
+    "Lastname": "last_name",
+    "Email": "email",
+    "Phone1": "phone",
+    "Address": "address",
+    "Address2": "address2",
+    "City": "city",
+    "State": "state",
+    "Zip": "zip_code",
+    "Gender": "gender",
+    "Dob": "dob",
+    "Education Level": "education_level",
+    "Grad Year": "grad_year",
+    "Military Type": "military_type",
+    "Campus Type": "campus_type",
+    "Area Of Study": "area_of_study",
+    "Level Of Interest": "level_of_interest",
+    "Computer with Internet": "computer_internet",
+    "US Citizen": "us_citizen",
+    "Registered Nurse": "registered_nurse",
+    "Teaching License": "teaching_license",
+    "Enroll Status": "enroll_status",
+    "Signup Url": "signup_url",
+    "Consent Url": "consent_url",
+    "Ip": "ip_address",
+    "Subid 2": "subid"
+}
+
+# Resolves {name: [selectors]} to {name: first visible, enabled element} in one
+# WebDriver round-trip. Selectors are tried in order; invalid ones are skipped.
+_FIND_FIELDS_JS = """
+const found = {};
+for (const [name, selectors] of Object.entries(arguments[0])) {
+    found[name] = null;
+    for (const selector of selectors) {
+        let matches;
+        try {
+            matches = document.querySelectorAll(selector);
+        } catch (e) {
+            continue;
+        }
+        const el = Array.from(matches).find(e =>
+            e.getClientRects().length && getComputedStyle(e).visibility !== 'hidden' && !e.disabled);
+        if (el) {
+            found[name] = el;
+            break;
+        }
+    }
+}
+return found;
+"""
+
+# Sets [name, element, value] triples in-page and fires the input/change events
+# the form listens for. Returns the names it could not set (e.g. no such option).
+_FILL_FIELDS_JS = """
+const failed = [];
+for (const [name, el, value] of arguments[0]) {
+    if (el.tagName.toLowerCase() === 'select') {
+        const options = Array.from(el.options);
+        const option = options.find(o => o.text.trim() === value) || options.find(o => o.value === value);
+        if (!option) {
+            failed.push(name);
+            continue;
+        }
+        el.value = option.value;
+    } else if (el.type === 'checkbox') {
+        if (el.checked !== Boolean(value)) {
+            el.click();
+        }
+        continue;
+    } else {
+        // Native setter so framework-controlled inputs register the change
+        const setter = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(el), 'value').set;
+        setter.call(el, value);
+        el.dispatchEvent(new Event('input', {bubbles: true}));
+    }
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+}
+return failed;
+"""
+
+# First visible submit control from the selector list, falling back to any button
+# whose label mentions "submit" (what the non-CSS :contains() selector was after)
+_FIND_SUBMIT_JS = """
+const usable = e => e.getClientRects().length && !e.disabled;
+for (const selector of arguments[0]) {
+    const el = Array.from(document.querySelectorAll(selector)).find(usable);
+    if (el) {
+        return el;
+    }
+}
+return Array.from(document.querySelectorAll('button, input[type="submit"], input[type="button"]'))
+    .find(e => usable(e) && /submit/i.test(e.textContent || e.value)) || null;
+"""
+
+# Returns [username, password, submit] once the login form has rendered, else null
+_LOGIN_FORM_JS = """
+const fields = [
+    document.querySelector('[name="username"]'),
+    document.querySelector('[name="password"]'),
+    document.querySelector('button[type="submit"], input[type="submit"]')
+];
+return fields.every(Boolean) ? fields : null;
+"""
+
+# Tags the success/error indicators already visible before submit (a btn-success
+# button, a field-hint class) so the status check below doesn't match them
+_MARK_PRESUBMIT_JS = """
+for (const e of document.querySelectorAll(arguments[0] + ', ' + arguments[1])) {
+    if (e.getClientRects().length) {
+        e.dataset.leadhoopPresubmit = '1';
+    }
+}
+"""
+
+# Returns {ok, text} for the first visible success (arguments[0]) or error
+# (arguments[1]) indicator shown since submit, or null while the page shows neither
+_SUBMISSION_STATUS_JS = """
+const visible = selector => Array.from(document.querySelectorAll(selector)).find(
+    e => e.getClientRects().length && !e.dataset.leadhoopPresubmit
+);
+const success = visible(arguments[0]);
+if (success) {
+    return {ok: true, text: success.innerText};
+}
+const error = visible(arguments[1]);
+if (error) {
+    return {ok: false, text: error.innerText};
+}
+return null;
+"""
 
 class EnhancedLeadHoopService:
     """Enhanced service for Lead Hoop integration with CSV processing and automation"""
     
+    # Selector tables are built once per process rather than on every call
+    _FIELD_MAPPINGS: ClassVar[Dict[str, Tuple[str, ...]]] = {
+        "first_name": (
+            'input[name="first_name"]',
+            'input[name="firstName"]',
+            'input[name="fname"]',
+            'input[name="FirstName"]',
+            '#first_name',
+            '#firstName',
+            '.first-name input',
+            'input[placeholder*="First"]',
+            'input[placeholder*="first"]'
+        ),
+        "last_name": (
+            'input[name="last_name"]',
+            'input[name="lastName"]',
+            'input[name="lname"]',
+            'input[name="LastName"]',
+            '#last_name',
+            '#lastName',
+            '.last-name input',
+            'input[placeholder*="Last"]',
+            'input[placeholder*="last"]'
+        ),
+        "email": (
+            'input[name="email"]',
+            'input[name="Email"]',
+            'input[type="email"]',
+            '#email',
+            '#Email',
+            '.email input',
+            'input[placeholder*="email"]',
+            'input[placeholder*="Email"]'
+        ),
+        "phone": (
+            'input[name="phone"]',
+            'input[name="Phone"]',
+            'input[name="phone1"]',
+            'input[name="telephone"]',
+            'input[type="tel"]',
+            '#phone',
+            '#Phone',
+            '#telephone',
+            '.phone input',
+            'input[placeholder*="phone"]',
+            'input[placeholder*="Phone"]'
+        ),
+        "address": (
+            'input[name="address"]',
+            'input[name="Address"]',
+            'input[name="street"]',
+            'textarea[name="address"]',
+            '#address',
+            '#Address',
+            '.address input',
+            '.address textarea'
+        ),
+        "city": (
+            'input[name="city"]',
+            'input[name="City"]',
+            '#city',
+            '#City',
+            '.city input'
+        ),
+        "state": (
+            'select[name="state"]',
+            'select[name="State"]',
+            'input[name="state"]',
+            '#state',
+            '#State',
+            '.state select',
+            '.state input'
+        ),
+        "zip_code": (
+            'input[name="zip"]',
+            'input[name="Zip"]',
+            'input[name="zipcode"]',
+            'input[name="postal_code"]',
+            '#zip',
+            '#Zip',
+            '#zipcode',
+            '.zip input'
+        ),
+        "education_level": (
+            'select[name="education"]',
+            'select[name="education_level"]',
+            'select[name="Education Level"]',
+            '#education',
+            '.education select'
+        ),
+        "area_of_study": (
+            'select[name="area_of_study"]',
+            'select[name="Area Of Study"]',
+            'input[name="area_of_study"]',
+            '#area_of_study',
+            '.area-of-study select'
+        ),
+        "level_of_interest": (
+            'select[name="interest_level"]',
+            'select[name="Level Of Interest"]',
+            'input[name="level_of_interest"]',
+            '#interest_level'
+        ),
+        "tcpa_consent": (
+            'input[name="tcpa"]',
+            'input[name="consent"]',
+            'input[name="agree"]',
+            'input[name="terms"]',
+            '#tcpa',
+            '#consent',
+            '.tcpa input',
+            '.consent input'
+        )
+    }
+
+    _SUCCESS_INDICATORS: ClassVar[Tuple[str, ...]] = (
+        '.success',
+        '.confirmation',
+        '.thank-you',
+        '.submitted',
+        '.complete',
+        '.alert-success',
+        '[class*="success"]',
+        '[class*="confirmation"]',
+        '[class*="thank"]',
+        '[class*="complete"]'
+    )
+
+    _ERROR_INDICATORS: ClassVar[Tuple[str, ...]] = (
+        '.error',
+        '.alert-danger',
+        '.alert-error',
+        '.validation-error',
+        '.form-error',
+        '.field-error',
+        '[class*="error"]',
+        '[class*="invalid"]',
+        '[class*="danger"]'
+    )
+
+    _SUBMIT_SELECTORS: ClassVar[Tuple[str, ...]] = (
+        'button[type="submit"]',
+        'input[type="submit"]',
+        'button.submit',
+        '.submit-btn',
+        'input[value*="Submit" i]'
+    )
+
+    # Combined selector lists for the single post-submit status check
+    _SUCCESS_SELECTOR: ClassVar[str] = ", ".join(_SUCCESS_INDICATORS)
+    _ERROR_SELECTOR: ClassVar[str] = ", ".join(_ERROR_INDICATORS)
+
+    _LEAD_ID_PATTERNS: ClassVar[Tuple[Pattern, ...]] = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'lead\s+id[:\s]+(\w+)',
+        r'id[:\s]+(\w+)',
+        r'reference[:\s]+(\w+)',
+        r'confirmation[:\s]+(\w+)',
+        r'number[:\s]+(\w+)',
+        r'#(\w+)',
+        r'ID:\s*(\w+)'
+    ))
+    
     def __init__(self):
         self.login_url = os.getenv("LEADHOOP_LOGIN_URL", "https://leadhoop.com/login")
         self.portal_url = os.getenv("LEADHOOP_PORTAL_URL", "https://leadhoop.com/portal")
         self.username = os.getenv("LEADHOOP_USERNAME")
         self.password = os.getenv("LEADHOOP_PASSWORD")
+        # Persistent Chrome profiles keep the portal session cookie between runs
+        self.chrome_profile_dir = os.path.expanduser(os.getenv("LEADHOOP_CHROME_PROFILE_DIR", "~/.leadhoop-chrome-profile"))
         self.driver = None
         self.wait = None
     
-    def setup_driver(self, headless: bool = False):
+    def setup_driver(self, headless: bool = False, profile_dir: Optional[str] = None):
         """Setup Chrome WebDriver with proper configuration"""
         chrome_options = Options()
         if headless:
             chrome_options.add_argument("--headless")
+        if profile_dir:
+            # Chrome locks a profile, so concurrent drivers each need their own directory
+            chrome_options.add_argument(f"--user-data-dir={profile_dir}")
+            chrome_options.add_argument("--profile-directory=Default")
         chrome_options.add_argument("--no-sandbox")
         chrome_options.add_argument("--disable-dev-shm-usage")
         chrome_options.add_argument("--disable-blink-features=AutomationControlled")
@@ -44,97 +396,119 @@ class EnhancedLeadHoopService:
             self.driver = None
             self.wait = None
     
-    def read_csv_leads(self, csv_file_path: str) -> List[Dict[str, Any]]:
-        """Read and parse CSV file with lead data"""
-        leads = []
+    def iter_csv_leads(self, csv_file_path: str, chunk_size: Optional[int] = None) -> Iterator[Any]:
+        """Lazily yield leads from a CSV file, or lists of up to chunk_size leads"""
+        leads = self._iter_csv_rows(csv_file_path)
+        if not chunk_size:
+            yield from leads
+            return
+        while chunk := list(itertools.islice(leads, chunk_size)):
+            yield chunk
+    
+    def _iter_csv_rows(self, csv_file_path: str) -> Iterator[Dict[str, Any]]:
+        """Read and parse CSV file with lead data, holding at most one batch in memory"""
+        count = 0
         try:
-            with open(csv_file_path, 'r', encoding='utf-8') as file:
-                csv_reader = csv.DictReader(file)
-                for row in csv_reader:
-                    # Map CSV columns to standardized format
-                    lead_data = self.map_csv_to_lead_data(row)
-                    leads.append(lead_data)
-            logger.info(f"Successfully read {len(leads)} leads from CSV")
-            return leads
+            if pl is not None:
+                rows = self._iter_csv_leads_polars(csv_file_path)
+            else:
+                rows = self._iter_csv_leads_dictreader(csv_file_path)
+            for lead_data in rows:
+                count += 1
+                yield lead_data
+            logger.info(f"Successfully read {count} leads from CSV")
         except Exception as e:
-            logger.error(f"Error reading CSV file: {str(e)}")
-            return []
+            logger.error(f"Error reading CSV file after {count} leads: {str(e)}")
+    
+    def _iter_csv_leads_dictreader(self, csv_file_path: str) -> Iterator[Dict[str, Any]]:
+        """Fallback reader used when polars is not installed"""
+        with open(csv_file_path, 'r', encoding='utf-8') as file:
+            csv_reader = csv.DictReader(file)
+            for row in csv_reader:
+                # Map CSV columns to standardized format
+                yield self.map_csv_to_lead_data(row)
+    
+    def _iter_csv_leads_polars(self, csv_file_path: str) -> Iterator[Dict[str, Any]]:
+        """Parse the CSV natively in batches and map columns with one select per batch"""
+        # infer_schema_length=0 reads every column as text, matching csv.DictReader
+        reader = pl.read_csv_batched(csv_file_path, batch_size=50_000, infer_schema_length=0)
+        while (batches := reader.next_batches(1)):
+            for batch in batches:
+                columns = [
+                    (pl.col(csv_key).fill_null("").str.strip_chars() if csv_key in batch.columns else pl.lit(""))
+                    .alias(lead_key)
+                    for csv_key, lead_key in CSV_TO_LEAD_MAP.items()
+                ]
+                # Assuming consent since consent_url is provided
+                columns.append(pl.lit(True).alias("tcpa_opt_in"))
+                yield from batch.select(columns).iter_rows(named=True)
     
     def map_csv_to_lead_data(self, csv_row: Dict[str, str]) -> Dict[str, Any]:
         """Map CSV row to standardized lead data format"""
-        return {
-            "first_name": csv_row.get("Firstname", "").strip(),
-            "last_name": csv_row.get("Lastname", "").strip(),
-            "email": csv_row.get("Email", "").strip(),
-            "phone": csv_row.get("Phone1", "").strip(),
-            "address": csv_row.get("Address", "").strip(),
-            "address2": csv_row.get("Address2", "").strip(),
-            "city": csv_row.get("City", "").strip(),
-            "state": csv_row.get("State", "").strip(),
-            "zip_code": csv_row.get("Zip", "").strip(),
-            "gender": csv_row.get("Gender", "").strip(),
-            "dob": csv_row.get("Dob", "").strip(),
-            "education_level": csv_row.get("Education Level", "").strip(),
-            "grad_year": csv_row.get("Grad Year", "").strip(),
-            "military_type": csv_row.get("Military Type", "").strip(),
-            "campus_type": csv_row.get("Campus Type", "").strip(),
-            "area_of_study": csv_row.get("Area Of Study", "").strip(),
-            "level_of_interest": csv_row.get("Level Of Interest", "").strip(),
-            "computer_internet": csv_row.get("Computer with Internet", "").strip(),
-            "us_citizen": csv_row.get("US Citizen", "").strip(),
-            "registered_nurse": csv_row.get("Registered Nurse", "").strip(),
-            "teaching_license": csv_row.get("Teaching License", "").strip(),
-            "enroll_status": csv_row.get("Enroll Status", "").strip(),
-            "signup_url": csv_row.get("Signup Url", "").strip(),
-            "consent_url": csv_row.get("Consent Url", "").strip(),
-            "tcpa_opt_in": True,  # Assuming consent since consent_url is provided
-            "ip_address": csv_row.get("Ip", "").strip(),
-            "subid": csv_row.get("Subid 2", "").strip()
+        lead_data = {
+            lead_key: (csv_row.get(csv_key) or "").strip()
+            for csv_key, lead_key in CSV_TO_LEAD_MAP.items()
         }
+        lead_data["tcpa_opt_in"] = True  # Assuming consent since consent_url is provided
+        return lead_data
     
-    def validate_lead_data(self, lead_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Enhanced validation for lead data"""
+    def validate_lead_data(self, lead_data: Dict[str, Any], today: Optional[date] = None,
+                           collect_warnings: bool = False) -> Dict[str, Any]:
+        """Enhanced validation for lead data (pass today to share one date across a batch)"""
         errors = []
         warnings = []
         
         # Required fields validation
-        required_fields = ["first_name", "last_name", "email", "phone"]
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if not lead_data.get(field):
                 errors.append(f"Missing required field: {field}")
         
+        # A lead missing required fields is invalid whatever else is wrong with it
+        if errors and not collect_warnings:
+            return {"valid": False, "errors": errors, "warnings": warnings}
+        
         # Email validation
         email = lead_data.get("email", "")
         if email:
-            email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-            if not re.match(email_pattern, email):
+            if not _EMAIL_RE.match(email):
                 errors.append("Invalid email format")
         
         # Phone validation
         phone = lead_data.get("phone", "")
         if phone:
-            phone_digits = ''.join(filter(str.isdigit, phone))
+            phone_digits = _NON_DIGIT_RE.sub('', phone)
+            # Bad lengths are errors whether or not warnings are collected
             if len(phone_digits) < 10:
-                warnings.append("Phone number appears to be incomplete")
+                errors.append("Phone number is incomplete")
             elif len(phone_digits) > 11:
-                warnings.append("Phone number appears to be too long")
+                errors.append("Phone number is too long")
+            elif phone_digits[-10:] in _PLACEHOLDER_PHONES or not _PHONE_RE.match(phone_digits):
+                # _PHONE_RE also rejects 11-digit numbers that don't start with 1
+                errors.append("Phone number is not a valid US number")
         
-        # Age validation based on DOB
-        dob = lead_data.get("dob", "")
-        if dob:
-            try:
+        # The remaining checks only produce warnings
+        if collect_warnings:
+            # Age validation based on DOB
+            dob = lead_data.get("dob", "")
+            if dob:
                 # Simple age check - assuming MM/DD/YYYY format
-                from datetime import datetime
-                birth_date = datetime.strptime(dob, "%m/%d/%Y")
-                age = (datetime.now() - birth_date).days // 365
-                if age < 18:
+                birth_date = None
+                match = _DOB_RE.match(dob)
+                if match:
+                    month, day, year = map(int, match.groups())
+                    try:
+                        birth_date = date(year, month, day)
+                    except ValueError:
+                        pass
+                
+                if birth_date is None:
+                    warnings.append("Invalid date of birth format")
+                elif ((today or date.today()) - birth_date).days // 365 < 18:
                     warnings.append("Lead appears to be under 18 years old")
-            except ValueError:
-                warnings.append("Invalid date of birth format")
-        
-        # TCPA consent validation
-        if not lead_data.get("tcpa_opt_in"):
-            warnings.append("TCPA consent not provided - may affect lead quality")
+            
+            # TCPA consent validation
+            if not lead_data.get("tcpa_opt_in"):
+                warnings.append("TCPA consent not provided - may affect lead quality")
         
         return {
             "valid": len(errors) == 0,
@@ -144,75 +518,74 @@ class EnhancedLeadHoopService:
     
     def format_lead_data_for_entry(self, lead_data: Dict[str, Any]) -> Dict[str, Any]:
         """Format lead data for Lead Hoop entry with enhanced formatting"""
-        formatted_data = {}
-        
-        # Name formatting
-        formatted_data["first_name"] = (lead_data.get("first_name", "")).strip().title()
-        formatted_data["last_name"] = (lead_data.get("last_name", "")).strip().title()
-        
-        # Email formatting
-        formatted_data["email"] = (lead_data.get("email", "")).strip().lower()
+        # Values arrive already stripped by map_csv_to_lead_data
+        formatted_data = {
+            field: op(lead_data.get(field, "")) for field, op in _FORMAT_OPS.items()
+        }
         
         # Phone formatting - handle various formats
         phone = lead_data.get("phone", "")
-        phone_digits = ''.join(filter(str.isdigit, phone))
-        if len(phone_digits) == 10:
-            formatted_data["phone"] = f"({phone_digits[:3]}) {phone_digits[3:6]}-{phone_digits[6:]}"
-        elif len(phone_digits) == 11 and phone_digits[0] == '1':
-            formatted_data["phone"] = f"({phone_digits[1:4]}) {phone_digits[4:7]}-{phone_digits[7:]}"
-        else:
-            formatted_data["phone"] = phone
+        phone_digits = _NON_DIGIT_RE.sub('', phone)
+        formatted_phone, matched = _PHONE_RE.subn(_PHONE_FMT, phone_digits)
+        formatted_data["phone"] = formatted_phone if matched else phone
         
         # Address formatting
-        full_address = lead_data.get("address", "").strip()
-        if lead_data.get("address2", "").strip():
-            full_address += f" {lead_data.get('address2', '').strip()}"
+        full_address = lead_data.get("address", "")
+        if lead_data.get("address2"):
+            full_address += f" {lead_data['address2']}"
         formatted_data["address"] = full_address.title()
-        formatted_data["city"] = (lead_data.get("city", "")).strip().title()
-        formatted_data["state"] = (lead_data.get("state", "")).strip().upper()
-        formatted_data["zip_code"] = (lead_data.get("zip_code", "")).strip()
-        
-        # Additional fields
-        formatted_data["education_level"] = lead_data.get("education_level", "")
-        formatted_data["area_of_study"] = lead_data.get("area_of_study", "")
-        formatted_data["level_of_interest"] = lead_data.get("level_of_interest", "")
-        formatted_data["military_type"] = lead_data.get("military_type", "")
-        formatted_data["campus_type"] = lead_data.get("campus_type", "")
         
         # Boolean fields
-        formatted_data["us_citizen"] = lead_data.get("us_citizen", "").lower() == "yes"
-        formatted_data["registered_nurse"] = lead_data.get("registered_nurse", "").lower() == "yes"
-        formatted_data["teaching_license"] = lead_data.get("teaching_license", "").lower() == "yes"
-        formatted_data["computer_internet"] = lead_data.get("computer_internet", "").lower() == "yes"
+        for field in _BOOL_FIELDS:
+            formatted_data[field] = lead_data.get(field) in _YES_VALUES
         formatted_data["tcpa_opt_in"] = bool(lead_data.get("tcpa_opt_in", False))
         
         return formatted_data
-    
+
     def login_to_leadhoop(self) -> bool:
         """Login to Lead Hoop portal"""
         try:
-            logger.info("Attempting to login to Lead Hoop portal")
-            self.driver.get(self.login_url)
-            
-            # Wait for login form
-            username_field = self.wait.until(EC.presence_of_element_located((By.NAME, "username")))
-            password_field = self.driver.find_element(By.NAME, "password")
-            login_button = self.driver.find_element(By.CSS_SELECTOR, "button[type='submit'], input[type='submit']")
-            
-            # Enter credentials
-            username_field.clear()
-            username_field.send_keys(self.username)
-            password_field.clear()
-            password_field.send_keys(self.password)
-            
-            # Click login
-            login_button.click()
+            # A persisted session cookie lands us on the portal without logging in
+            self.driver.get(self.portal_url)
+            if self.driver.current_url.startswith(self.portal_url):
+                logger.info("Reusing saved Lead Hoop portal session")
+                return True
             
-            # Wait for redirect to portal
-            self.wait.until(lambda driver: driver.current_url != self.login_url)
+            logger.info("Attempting to login to Lead Hoop portal")
+            credentials = {"username": self.username, "password": self.password}
             
-            logger.info("Successfully logged into Lead Hoop portal")
-            return True
+            # Set credentials in-page first; retype them if the page ignores scripted input
+            for simulate_typing in (False, True):
+                self.driver.get(self.login_url)
+                
+                # Wait for login form and grab all of its controls in one call
+                username_field, password_field, login_button = self.wait.until(
+                    lambda driver: driver.execute_script(_LOGIN_FORM_JS)
+                )
+                fields = {"username": username_field, "password": password_field}
+                
+                # Enter credentials
+                if simulate_typing:
+                    self._type_form_fields(fields, credentials)
+                else:
+                    self.driver.execute_script(_FILL_FIELDS_JS, [
+                        [name, element, credentials[name]] for name, element in fields.items()
+                    ])
+                
+                # Click login
+                login_button.click()
+                
+                # Wait for redirect to portal
+                try:
+                    self.wait.until(lambda driver: driver.current_url != self.login_url)
+                except TimeoutException:
+                    if simulate_typing:
+                        raise
+                    logger.warning("Login did not redirect, retrying with typed credentials")
+                    continue
+                
+                logger.info("Successfully logged into Lead Hoop portal")
+                return True
             
         except Exception as e:
             logger.error(f"Failed to login to Lead Hoop portal: {str(e)}")
@@ -220,16 +593,14 @@ class EnhancedLeadHoopService:
     
     def find_form_field(self, field_selectors: List[str]) -> Optional[Any]:
         """Find form field using multiple selector strategies"""
-        for selector in field_selectors:
-            try:
-                element = self.driver.find_element(By.CSS_SELECTOR, selector)
-                if element.is_displayed() and element.is_enabled():
-                    return element
-            except NoSuchElementException:
-                continue
-        return None
+        return self.find_form_fields({"field": field_selectors})["field"]
+    
+    def find_form_fields(self, field_selectors: Dict[str, Any]) -> Dict[str, Optional[Any]]:
+        """Resolve several form fields with a single in-page lookup"""
+        # Selector tuples serialize as JS arrays, so the cached constants pass straight through
+        return self.driver.execute_script(_FIND_FIELDS_JS, field_selectors)
     
-    def fill_lead_form(self, lead_data: Dict[str, Any]) -> bool:
+    def fill_lead_form(self, lead_data: Dict[str, Any], simulate_typing: bool = False) -> bool:
         """Fill the lead form with provided data"""
         try:
             logger.info("Filling lead form")
@@ -238,103 +609,111 @@ class EnhancedLeadHoopService:
             field_mappings = self.get_form_field_mappings()
             formatted_data = self.format_lead_data_for_entry(lead_data)
             
-            # Fill each field
-            for field_name, value in formatted_data.items():
-                if not value:
-                    continue
-                    
-                selectors = field_mappings.get(field_name, [])
-                if not selectors:
-                    continue
-                
-                element = self.find_form_field(selectors)
+            # Locate every field that has a value in one round-trip
+            elements = self.find_form_fields({
+                field_name: field_mappings[field_name]
+                for field_name, value in formatted_data.items()
+                if value and field_name in field_mappings
+            })
+            
+            found = {}
+            for field_name, element in elements.items():
                 if element:
-                    try:
-                        if element.tag_name.lower() == 'select':
-                            # Handle select dropdown
-                            select = Select(element)
-                            try:
-                                select.select_by_visible_text(str(value))
-                            except:
-                                select.select_by_value(str(value))
-                        elif element.get_attribute('type') == 'checkbox':
-                            # Handle checkbox
-                            if value and not element.is_selected():
-                                element.click()
-                            elif not value and element.is_selected():
-                                element.click()
-                        else:
-                            # Handle text input
-                            element.clear()
-                            element.send_keys(str(value))
-                        
-                        logger.debug(f"Successfully filled {field_name}")
-                    except Exception as e:
-                        logger.warning(f"Failed to fill {field_name}: {str(e)}")
+                    found[field_name] = element
                 else:
                     logger.warning(f"Could not find form field for {field_name}")
             
+            if simulate_typing:
+                self._type_form_fields(found, formatted_data)
+                return True
+            
+            # Write every field with a single script
+            fields = []
+            for field_name, element in found.items():
+                value = formatted_data[field_name]
+                fields.append([field_name, element, value if isinstance(value, bool) else str(value)])
+            
+            try:
+                failed = self.driver.execute_script(_FILL_FIELDS_JS, fields)
+            except Exception as e:
+                logger.warning(f"In-page form fill failed, typing fields instead: {str(e)}")
+                failed = list(found)
+            
+            # Fall back to WebDriver input for anything the script couldn't set
+            if failed:
+                self._type_form_fields({name: found[name] for name in failed}, formatted_data)
+            
             return True
             
         except Exception as e:
             logger.error(f"Error filling lead form: {str(e)}")
             return False
     
+    def _type_form_fields(self, elements: Dict[str, Any], formatted_data: Dict[str, Any]):
+        """Fill fields element by element with simulated keystrokes and clicks"""
+        for field_name, element in elements.items():
+            value = formatted_data[field_name]
+            try:
+                if element.tag_name.lower() == 'select':
+                    # Handle select dropdown
+                    select = Select(element)
+                    try:
+                        select.select_by_visible_text(str(value))
+                    except:
+                        select.select_by_value(str(value))
+                elif element.get_attribute('type') == 'checkbox':
+                    # Handle checkbox
+                    if value and not element.is_selected():
+                        element.click()
+                    elif not value and element.is_selected():
+                        element.click()
+                else:
+                    # Handle text input
+                    element.clear()
+                    element.send_keys(str(value))
+                
+                logger.debug(f"Successfully filled {field_name}")
+            except Exception as e:
+                logger.warning(f"Failed to fill {field_name}: {str(e)}")
+    
     def submit_lead_form(self) -> Dict[str, Any]:
         """Submit the lead form and check for success/errors"""
         try:
             logger.info("Submitting lead form")
             
             # Find and click submit button
-            submit_selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button.submit',
-                '.submit-btn',
-                'button:contains("Submit")',
-                'input[value*="Submit"]'
-            ]
-            
-            submit_button = self.find_form_field(submit_selectors)
+            submit_button = self.driver.execute_script(_FIND_SUBMIT_JS, self._SUBMIT_SELECTORS)
             if not submit_button:
                 return {"success": False, "error": "Could not find submit button"}
             
+            self.driver.execute_script(_MARK_PRESUBMIT_JS, self._SUCCESS_SELECTOR, self._ERROR_SELECTOR)
             submit_button.click()
             
-            # Wait a moment for response
-            time.sleep(2)
+            # Wait for a success or error indicator to appear
+            try:
+                status = self.wait.until(lambda driver: driver.execute_script(
+                    _SUBMISSION_STATUS_JS, self._SUCCESS_SELECTOR, self._ERROR_SELECTOR
+                ))
+            except TimeoutException:
+                status = None
             
-            # Check for success indicators
-            success_indicators = self.get_success_indicators()
-            for indicator in success_indicators:
-                try:
-                    success_element = self.driver.find_element(By.CSS_SELECTOR, indicator)
-                    if success_element.is_displayed():
-                        success_text = success_element.text
-                        lead_id = self.extract_lead_id(success_text)
-                        logger.info(f"Lead submitted successfully. ID: {lead_id}")
-                        return {
-                            "success": True,
-                            "lead_id": lead_id,
-                            "message": success_text
-                        }
-                except NoSuchElementException:
-                    continue
+            if status and status["ok"]:
+                success_text = status["text"]
+                lead_id = self.extract_lead_id(success_text)
+                logger.info(f"Lead submitted successfully. ID: {lead_id}")
+                return {
+                    "success": True,
+                    "lead_id": lead_id,
+                    "message": success_text
+                }
             
-            # Check for error indicators
-            error_indicators = self.get_error_indicators()
-            for indicator in error_indicators:
-                try:
-                    error_element = self.driver.find_element(By.CSS_SELECTOR, indicator)
-                    if error_element.is_displayed():
-                        error_text = error_element.text
-                        logger.error(f"Lead submission failed: {error_text}")
-                        return {
-                            "success": False,
-                            "error": error_text
-                        }
-                except NoSuchElementException:
-                    continue
+            if status:
+                error_text = status["text"]
+                logger.error(f"Lead submission failed: {error_text}")
+                return {
+                    "success": False,
+                    "error": error_text
+                }
             
             # No clear success/error indicator found
             logger.warning("Could not determine submission status")
@@ -349,9 +728,8 @@ class EnhancedLeadHoopService:
     
     def extract_lead_id(self, text: str) -> Optional[str]:
         """Extract lead ID from success message"""
-        patterns = self.extract_lead_id_patterns()
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in self.extract_lead_id_patterns():
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         return None
@@ -395,196 +773,134 @@ class EnhancedLeadHoopService:
             result["submission"] = {"success": False, "error": str(e)}
             return result
     
-    def process_csv_file(self, csv_file_path: str) -> List[Dict[str, Any]]:
-        """Process entire CSV file of leads"""
+    def process_csv_file(self, csv_file_path: str, workers: Optional[int] = None,
+                         headless: bool = True, chunk_size: int = 500) -> List[Dict[str, Any]]:
+        """Process entire CSV file of leads across a pool of logged-in Chrome workers"""
         results = []
+        pool = None
         
         try:
-            # Setup driver
-            self.setup_driver()
-            
-            # Login
-            if not self.login_to_leadhoop():
-                logger.error("Failed to login to Lead Hoop portal")
-                return results
+            # Each worker owns one browser session and reuses it for all of its leads
+            workers = workers or max(1, (os.cpu_count() or 2) // 2)
+            # One date for the whole run rather than a date.today() per lead
+            today = date.today()
             
-            # Read CSV
-            leads = self.read_csv_leads(csv_file_path)
-            
-            # Process each lead
-            for i, lead_data in enumerate(leads, 1):
-                logger.info(f"Processing lead {i}/{len(leads)}")
-                result = self.process_single_lead(lead_data)
-                results.append(result)
+            # Stream the CSV in chunks so only chunk_size leads are queued at a time
+            for chunk in self.iter_csv_leads(csv_file_path, chunk_size=chunk_size):
+                if pool is None:
+                    # A short first chunk is the whole file; don't start idle browsers
+                    workers = min(workers, len(chunk))
+                    logger.info(f"Processing leads with {workers} browser workers")
+                    # Workers claim profile slots 0..workers-1, so each run reuses the same profiles
+                    profile_slots = multiprocessing.Value('i', 0)
+                    pool = multiprocessing.Pool(workers, initializer=_init_worker, initargs=(headless, profile_slots))
+                
+                # Validate in this process so invalid leads never tie up a browser
+                valid_leads = []
+                for lead_data in chunk:
+                    validation_result = self.validate_lead_data(lead_data, today=today)
+                    if validation_result["valid"]:
+                        valid_leads.append(lead_data)
+                    else:
+                        logger.error(f"Lead validation failed: {validation_result['errors']}")
+                        results.append({
+                            "lead_data": lead_data,
+                            "validation": validation_result,
+                            "submission": None,
+                            "success": False
+                        })
                 
-                # Add delay between submissions
-                time.sleep(1)
+                for result in pool.imap(_process_lead_in_worker, valid_leads, chunksize=4):
+                    results.append(result)
+                    logger.info(f"Processed lead {len(results)}")
             
+            # Let workers exit normally so their finalizers quit Chrome
+            if pool:
+                pool.close()
+                pool.join()
             logger.info(f"Completed processing {len(results)} leads")
             
         except Exception as e:
             logger.error(f"Error processing CSV file: {str(e)}")
-        finally:
-            self.close_driver()
+            if pool:
+                # Workers turn the terminate signal into a normal exit, which runs
+                # their close_driver finalizers before terminate() returns
+                pool.terminate()
         
         return results
     
-    def get_form_field_mappings(self) -> Dict[str, List[str]]:
+    def get_form_field_mappings(self) -> Dict[str, Tuple[str, ...]]:
         """Enhanced form field selectors for Lead Hoop portal"""
-        return {
-            "first_name": [
-                'input[name="first_name"]',
-                'input[name="firstName"]',
-                'input[name="fname"]',
-                'input[name="FirstName"]',
-                '#first_name',
-                '#firstName',
-                '.first-name input',
-                'input[placeholder*="First"]',
-                'input[placeholder*="first"]'
-            ],
-            "last_name": [
-                'input[name="last_name"]',
-                'input[name="lastName"]',
-                'input[name="lname"]',
-                'input[name="LastName"]',
-                '#last_name',
-                '#lastName',
-                '.last-name input',
-                'input[placeholder*="Last"]',
-                'input[placeholder*="last"]'
-            ],
-            "email": [
-                'input[name="email"]',
-                'input[name="Email"]',
-                'input[type="email"]',
-                '#email',
-                '#Email',
-                '.email input',
-                'input[placeholder*="email"]',
-                'input[placeholder*="Email"]'
-            ],
-            "phone": [
-                'input[name="phone"]',
-                'input[name="Phone"]',
-                'input[name="phone1"]',
-                'input[name="telephone"]',
-                'input[type="tel"]',
-                '#phone',
-                '#Phone',
-                '#telephone',
-                '.phone input',
-                'input[placeholder*="phone"]',
-                'input[placeholder*="Phone"]'
-            ],
-            "address": [
-                'input[name="address"]',
-                'input[name="Address"]',
-                'input[name="street"]',
-                'textarea[name="address"]',
-                '#address',
-                '#Address',
-                '.address input',
-                '.address textarea'
-            ],
-            "city": [
-                'input[name="city"]',
-                'input[name="City"]',
-                '#city',
-                '#City',
-                '.city input'
-            ],
-            "state": [
-                'select[name="state"]',
-                'select[name="State"]',
-                'input[name="state"]',
-                '#state',
-                '#State',
-                '.state select',
-                '.state input'
-            ],
-            "zip_code": [
-                'input[name="zip"]',
-                'input[name="Zip"]',
-                'input[name="zipcode"]',
-                'input[name="postal_code"]',
-                '#zip',
-                '#Zip',
-                '#zipcode',
-                '.zip input'
-            ],
-            "education_level": [
-                'select[name="education"]',
-                'select[name="education_level"]',
-                'select[name="Education Level"]',
-                '#education',
-                '.education select'
-            ],
-            "area_of_study": [
-                'select[name="area_of_study"]',
-                'select[name="Area Of Study"]',
-                'input[name="area_of_study"]',
-                '#area_of_study',
-                '.area-of-study select'
-            ],
-            "level_of_interest": [
-                'select[name="interest_level"]',
-                'select[name="Level Of Interest"]',
-                'input[name="level_of_interest"]',
-                '#interest_level'
-            ],
-            "tcpa_consent": [
-                'input[name="tcpa"]',
-                'input[name="consent"]',
-                'input[name="agree"]',
-                'input[name="terms"]',
-                '#tcpa',
-                '#consent',
-                '.tcpa input',
-                '.consent input'
-            ]
-        }
+        return self._FIELD_MAPPINGS
     
-    def get_success_indicators(self) -> List[str]:
+    def get_success_indicators(self) -> Tuple[str, ...]:
         """Success indicators after form submission"""
-        return [
-            '.success',
-            '.confirmation',
-            '.thank-you',
-            '.submitted',
-            '.complete',
-            '.alert-success',
-            '[class*="success"]',
-            '[class*="confirmation"]',
-            '[class*="thank"]',
-            '[class*="complete"]'
-        ]
+        return self._SUCCESS_INDICATORS
     
-    def get_error_indicators(self) -> List[str]:
+    def get_error_indicators(self) -> Tuple[str, ...]:
         """Error indicators after form submission"""
-        return [
-            '.error',
-            '.alert-danger',
-            '.alert-error',
-            '.validation-error',
-            '.form-error',
-            '.field-error',
-            '[class*="error"]',
-            '[class*="invalid"]',
-            '[class*="danger"]'
-        ]
+        return self._ERROR_INDICATORS
     
-    def extract_lead_id_patterns(self) -> List[str]:
-        """Regex patterns for extracting lead IDs"""
-        return [
-            r'lead\s+id[:\s]+(\w+)',
-            r'id[:\s]+(\w+)',
-            r'reference[:\s]+(\w+)',
-            r'confirmation[:\s]+(\w+)',
-            r'number[:\s]+(\w+)',
-            r'#(\w+)',
-            r'ID:\s*(\w+)'
-        ]
+    def extract_lead_id_patterns(self) -> Tuple[Pattern, ...]:
+        """Precompiled regex patterns for extracting lead IDs"""
+        return self._LEAD_ID_PATTERNS
+
+# Per-process service used by process_csv_file's worker pool
+_worker_service: Optional[EnhancedLeadHoopService] = None
+_worker_logged_in = False
+
+def _init_worker(headless: bool, profile_slots: Any):
+    """Pool initializer: start one browser per worker and log in once"""
+    global _worker_service, _worker_logged_in
+    with profile_slots.get_lock():
+        slot = profile_slots.value
+        profile_slots.value += 1
+    
+    _worker_service = EnhancedLeadHoopService()
+    profile_dir = os.path.join(_worker_service.chrome_profile_dir, f"worker-{slot}")
+    # An initializer that raises makes the pool respawn workers forever, so failures
+    # only mark this worker as logged out and its leads come back as errors
+    try:
+        _worker_service.setup_driver(headless=headless, profile_dir=profile_dir)
+    except Exception as e:
+        logger.error(f"Failed to start Chrome in worker {slot}: {str(e)}")
+        # setup_driver may fail after Chrome launched; don't leave it running
+        try:
+            _worker_service.close_driver()
+        except Exception:
+            pass
+        _worker_logged_in = False
+        return
+    
+    # Pool workers skip atexit handlers; Finalize runs when the worker shuts down
+    multiprocessing.util.Finalize(_worker_service, _worker_service.close_driver, exitpriority=10)
+    # pool.terminate() sends SIGTERM; exit through SystemExit so the finalizer still quits Chrome
+    if os.name != "nt":
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    
+    try:
+        _worker_logged_in = _worker_service.login_to_leadhoop()
+    except Exception as e:
+        logger.error(f"Login raised in worker {slot}: {str(e)}")
+        _worker_logged_in = False
+    if not _worker_logged_in:
+        logger.error("Failed to login to Lead Hoop portal")
+
+def _process_lead_in_worker(lead_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Submit one lead using this worker's logged-in session"""
+    if not _worker_logged_in:
+        return {
+            "lead_data": lead_data,
+            "validation": None,
+            "submission": {"success": False, "error": "Failed to login to Lead Hoop portal"},
+            "success": False
+        }
+    
+    # Each submission already waits on the portal's response, so no extra delay is needed
+    return _worker_service.process_single_lead(lead_data)
+
+# Shared instance so callers reuse one set of env-derived settings
+leadhoop_service = EnhancedLeadHoopService()
 
 # Usage example
 if __name__ == "__main__":
@@ -1,11 +1,95 @@
 import os
+import io
+import time
+import asyncio
+import hashlib
+import gzip
+import shutil
 import boto3
 import tempfile
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import Optional, Dict, Any, Union, BinaryIO, Iterator, AsyncIterator, List, Tuple
 from loguru import logger
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from datetime import datetime
 
+# Keep-alive connection pool shared by every request the client makes. "auto" addressing
+# falls back to path-style for bucket names with dots, which fail TLS as virtual hosts.
+S3_CLIENT_CONFIG = Config(
+    signature_version="s3v4",
+    s3={"addressing_style": "auto"},
+    max_pool_connections=50,
+    retries={"mode": "adaptive", "max_attempts": 10},
+    tcp_keepalive=True
+)
+
+# S3_ACCELERATE=true routes via Transfer Acceleration, which rejects dotted bucket names
+S3_ACCELERATE = os.getenv("S3_ACCELERATE", "false").lower() == "true"
+
+def _s3_client_config(bucket_name: str) -> Config:
+    """Force virtual-hosted addressing (and acceleration if enabled) for dot-free bucket names"""
+    if "." in bucket_name:
+        if S3_ACCELERATE:
+            logger.warning(f"S3_ACCELERATE ignored: bucket {bucket_name} has dots in its name")
+        return S3_CLIENT_CONFIG
+    return S3_CLIENT_CONFIG.merge(Config(s3={
+        "addressing_style": "virtual",
+        "use_accelerate_endpoint": S3_ACCELERATE
+    }))
+
+# Uploads over 8 MB go up as parallel 16 MB multipart chunks; smaller ones are a single PUT.
+# 8 MB leaves headroom over S3's 5 MB minimum part size.
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+S3_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=10,
+    use_threads=True
+)
+
+# The YYYY/MM/DD key prefix only changes at UTC midnight
+_DAY_CACHE = {"day": None, "prefix": None}
+
+def _utc_day_prefix() -> str:
+    """Return today's YYYY/MM/DD key prefix, formatting it once per day"""
+    today = datetime.utcnow().date()
+    if _DAY_CACHE["day"] != today:
+        _DAY_CACHE["day"] = today
+        _DAY_CACHE["prefix"] = today.strftime("%Y/%m/%d")
+    return _DAY_CACHE["prefix"]
+
+def _gzip_payload(data: Union[bytes, BinaryIO]) -> Union[bytes, BinaryIO]:
+    """Gzip bytes in memory, or a file object into a spooled temp file"""
+    if isinstance(data, (bytes, bytearray)):
+        return gzip.compress(data, compresslevel=6)
+    
+    spool = tempfile.SpooledTemporaryFile(max_size=MULTIPART_THRESHOLD)
+    with gzip.GzipFile(fileobj=spool, mode='wb', compresslevel=6) as gz:
+        shutil.copyfileobj(data, gz)
+    spool.seek(0)
+    return spool
+
+@lru_cache(maxsize=None)
+def _make_s3_client(aws_access_key: str, aws_secret_key: str, aws_region: str, bucket_name: str):
+    """One client per credential set and bucket; low-level boto3 clients are thread-safe"""
+    return boto3.client(
+        's3',
+        aws_access_key_id=aws_access_key,
+        aws_secret_access_key=aws_secret_key,
+        region_name=aws_region,
+        config=_s3_client_config(bucket_name)
+    )
+
+# Presigned URLs are reused until this long before they expire
+PRESIGNED_URL_REFRESH_MARGIN = 300
+PRESIGNED_URL_CACHE_SIZE = 10000
+
+# Seconds a bucket check result is reused; failures are retried sooner
+CONNECTION_TEST_TTL = 60
+CONNECTION_TEST_FAILURE_TTL = 10
+
 class S3Service:
     """Service for handling S3 operations for call recordings and other files"""
     
@@ -14,15 +98,16 @@ class S3Service:
         self.aws_secret_key = os.getenv("AWS_SECRET_ACCESS_KEY")
         self.aws_region = os.getenv("AWS_REGION", "us-east-1")
         self.bucket_name = os.getenv("S3_BUCKET_NAME", "mergeai.call.recordings")
+        # (s3_key, expires_in) -> (reuse_until, presigned_url)
+        self._url_cache: Dict[Tuple[str, int], Tuple[float, str]] = {}
+        # (tested_at, result) of the last bucket check
+        self._last_test: Optional[Tuple[float, Dict[str, Any]]] = None
         
         # Initialize S3 client
         try:
             if self.aws_access_key and self.aws_secret_key:
-                self.s3_client = boto3.client(
-                    's3',
-                    aws_access_key_id=self.aws_access_key,
-                    aws_secret_access_key=self.aws_secret_key,
-                    region_name=self.aws_region
+                self.s3_client = _make_s3_client(
+                    self.aws_access_key, self.aws_secret_key, self.aws_region, self.bucket_name
                 )
                 logger.info(f"S3 Service initialized - Bucket: {self.bucket_name}, Region: {self.aws_region}")
             else:
@@ -33,8 +118,21 @@ class S3Service:
             logger.error(f"Failed to initialize S3 client: {e}")
             self.s3_client = None
     
-    async def test_connection(self) -> Dict[str, Any]:
-        """Test S3 connection and bucket access"""
+    async def test_connection(self, force: bool = False) -> Dict[str, Any]:
+        """Test S3 connection and bucket access, reusing a recent result unless forced"""
+        now = time.monotonic()
+        if not force and self._last_test:
+            tested_at, result = self._last_test
+            ttl = CONNECTION_TEST_TTL if result["success"] else CONNECTION_TEST_FAILURE_TTL
+            if now - tested_at < ttl:
+                return result
+        
+        result = await self._check_connection()
+        self._last_test = (now, result)
+        return result
+    
+    async def _check_connection(self) -> Dict[str, Any]:
+        """Probe bucket access with a HEAD request"""
         if not self.s3_client:
             return {
                 "success": False,
@@ -43,7 +141,7 @@ class S3Service:
         
         try:
             # Test bucket access
-            response = self.s3_client.head_bucket(Bucket=self.bucket_name)
+            response = await asyncio.to_thread(self.s3_client.head_bucket, Bucket=self.bucket_name)
             
             return {
                 "success": True,
@@ -72,30 +170,63 @@ class S3Service:
                 "error": f"S3 connection error: {str(e)}"
             }
     
-    async def upload_recording(self, recording_data: bytes, filename: str) -> Optional[str]:
-        """Upload call recording to S3"""
+    async def _upload(self, data: Union[bytes, BinaryIO, AsyncIterator[bytes]], s3_key: str,
+                      content_type: str, source: str, content_encoding: Optional[str] = None):
+        """Upload bytes, a binary file object or an async byte stream off the event loop"""
+        if hasattr(data, '__aiter__'):
+            # Spool streamed bodies in memory up to the multipart threshold, then on disk
+            with tempfile.SpooledTemporaryFile(max_size=MULTIPART_THRESHOLD) as spool:
+                async for chunk in data:
+                    spool.write(chunk)
+                spool.seek(0)
+                await self._upload(spool, s3_key, content_type, source, content_encoding)
+            return
+        
+        metadata = {
+            'uploaded_at': datetime.utcnow().isoformat(),
+            'source': source
+        }
+        extra_args = {'ContentType': content_type, 'Metadata': metadata}
+        if content_encoding:
+            extra_args['ContentEncoding'] = content_encoding
+        
+        # Small payloads are one PUT; skip the transfer manager and its thread pool
+        if isinstance(data, (bytes, bytearray)) and len(data) < MULTIPART_THRESHOLD:
+            await asyncio.to_thread(
+                self.s3_client.put_object,
+                Bucket=self.bucket_name,
+                Key=s3_key,
+                Body=data,
+                **extra_args
+            )
+            return
+        
+        fileobj = io.BytesIO(data) if isinstance(data, (bytes, bytearray)) else data
+        await asyncio.to_thread(
+            self.s3_client.upload_fileobj,
+            fileobj,
+            self.bucket_name,
+            s3_key,
+            ExtraArgs=extra_args,
+            Config=S3_TRANSFER_CONFIG
+        )
+    
+    async def upload_recording(self, recording_data: Union[bytes, BinaryIO, AsyncIterator[bytes]], filename: str) -> Optional[str]:
+        """Upload call recording (bytes, a binary file object or an async byte stream) to S3"""
         if not self.s3_client:
             logger.warning("S3 client not configured - cannot upload recording")
             return None
             
         try:
-            # Generate S3 key with proper structure
-            timestamp = datetime.utcnow().strftime("%Y/%m/%d")
-            s3_key = f"recordings/{timestamp}/{filename}"
+            # Generate S3 key with proper structure; the short hash spreads keys across partitions
+            timestamp = _utc_day_prefix()
+            shard = hashlib.md5(filename.encode()).hexdigest()[:4]
+            s3_key = f"recordings/{shard}/{timestamp}/{filename}"
             
             logger.info(f"Uploading recording to S3: {s3_key}")
             
-            # Upload to S3
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=recording_data,
-                ContentType='audio/mpeg',
-                Metadata={
-                    'uploaded_at': datetime.utcnow().isoformat(),
-                    'source': 'vapi_call_recording'
-                }
-            )
+            # Upload to S3, switching to multipart for large recordings
+            await self._upload(recording_data, s3_key, 'audio/mpeg', 'vapi_call_recording')
             
             logger.info(f"Successfully uploaded recording: {s3_key}")
             return s3_key
@@ -110,6 +241,13 @@ class S3Service:
             logger.warning("S3 client not configured - cannot generate presigned URL")
             return None
             
+        # Reuse a previously signed URL while it still has time left
+        now = time.monotonic()
+        cache_key = (s3_key, expires_in)
+        cached = self._url_cache.get(cache_key)
+        if cached and cached[0] > now:
+            return cached[1]
+            
         try:
             presigned_url = self.s3_client.generate_presigned_url(
                 'get_object',
@@ -117,6 +255,13 @@ class S3Service:
                 ExpiresIn=expires_in
             )
             
+            if len(self._url_cache) >= PRESIGNED_URL_CACHE_SIZE:
+                self._url_cache = {key: entry for key, entry in self._url_cache.items() if entry[0] > now}
+                if len(self._url_cache) >= PRESIGNED_URL_CACHE_SIZE:
+                    self._url_cache.clear()
+            reuse_for = expires_in - min(PRESIGNED_URL_REFRESH_MARGIN, expires_in // 2)
+            self._url_cache[cache_key] = (now + reuse_for, presigned_url)
+            
             logger.debug(f"Generated presigned URL for {s3_key}")
             return presigned_url
             
@@ -124,30 +269,26 @@ class S3Service:
             logger.error(f"Failed to generate presigned URL for {s3_key}: {e}")
             return None
     
-    async def upload_csv_file(self, csv_data: bytes, filename: str) -> Optional[str]:
-        """Upload CSV file to S3"""
+    async def upload_csv_file(self, csv_data: Union[bytes, BinaryIO], filename: str) -> Optional[str]:
+        """Upload CSV file (bytes or a binary file object) to S3"""
         if not self.s3_client:
             logger.warning("S3 client not configured - cannot upload CSV")
             return None
             
         try:
             # Generate S3 key for CSV files
-            timestamp = datetime.utcnow().strftime("%Y/%m/%d")
+            timestamp = _utc_day_prefix()
             s3_key = f"csv_uploads/{timestamp}/{filename}"
+            if not s3_key.endswith(".gz"):
+                s3_key += ".gz"
             
             logger.info(f"Uploading CSV to S3: {s3_key}")
             
-            # Upload to S3
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=csv_data,
-                ContentType='text/csv',
-                Metadata={
-                    'uploaded_at': datetime.utcnow().isoformat(),
-                    'source': 'csv_import'
-                }
-            )
+            # CSV text compresses well; clients that send Accept-Encoding: gzip decompress transparently
+            compressed = await asyncio.to_thread(_gzip_payload, csv_data)
+            
+            # Upload to S3, switching to multipart for large files
+            await self._upload(compressed, s3_key, 'text/csv', 'csv_import', content_encoding='gzip')
             
             logger.info(f"Successfully uploaded CSV: {s3_key}")
             return s3_key
@@ -156,27 +297,37 @@ class S3Service:
             logger.error(f"Failed to upload CSV {filename}: {e}")
             return None
     
-    async def list_recordings(self, prefix: str = "recordings/", max_keys: int = 100) -> list:
-        """List recordings in S3 bucket"""
+    def iter_recordings(self, prefix: str = "recordings/", max_keys: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Lazily page through recordings in S3 bucket, 1000 keys per request"""
         if not self.s3_client:
             logger.warning("S3 client not configured - cannot list recordings")
-            return []
-            
-        try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.bucket_name,
-                Prefix=prefix,
-                MaxKeys=max_keys
-            )
-            
-            recordings = []
-            for obj in response.get('Contents', []):
-                recordings.append({
+            return
+        
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        pages = paginator.paginate(
+            Bucket=self.bucket_name,
+            Prefix=prefix,
+            # Don't fetch a full 1000-key page when only a few keys are wanted
+            PaginationConfig={'PageSize': min(1000, max_keys or 1000), 'MaxItems': max_keys}
+        )
+        for page in pages:
+            for obj in page.get('Contents', ()):
+                yield {
                     'key': obj['Key'],
+                    'filename': obj['Key'].rpartition('/')[2],
                     'size': obj['Size'],
                     'last_modified': obj['LastModified'].isoformat(),
                     'etag': obj['ETag'].strip('"')
-                })
+                }
+    
+    async def list_recordings(self, prefix: str = "recordings/", max_keys: Optional[int] = 100) -> List[Dict[str, Any]]:
+        """List recordings in S3 bucket (max_keys=None lists every page)"""
+        if not self.s3_client:
+            logger.warning("S3 client not configured - cannot list recordings")
+            return []
+            
+        try:
+            recordings = await asyncio.to_thread(lambda: list(self.iter_recordings(prefix, max_keys)))
             
             logger.info(f"Found {len(recordings)} recordings in S3")
             return recordings
@@ -185,24 +336,45 @@ class S3Service:
             logger.error(f"Failed to list recordings: {e}")
             return []
     
-    async def delete_recording(self, s3_key: str) -> bool:
-        """Delete recording from S3"""
+    async def delete_recordings(self, s3_keys: List[str]) -> Dict[str, Any]:
+        """Delete recordings from S3 in batches of up to 1000 keys per request"""
         if not self.s3_client:
-            logger.warning("S3 client not configured - cannot delete recording")
-            return False
-            
-        try:
-            self.s3_client.delete_object(
+            logger.warning("S3 client not configured - cannot delete recordings")
+            return {"deleted": 0, "errors": [{"Key": key, "Message": "S3 client not configured"} for key in s3_keys]}
+        
+        def delete_batch(batch: List[str]) -> List[Dict[str, Any]]:
+            response = self.s3_client.delete_objects(
                 Bucket=self.bucket_name,
-                Key=s3_key
+                Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
             )
-            
-            logger.info(f"Successfully deleted recording: {s3_key}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Failed to delete recording {s3_key}: {e}")
-            return False
+            # Quiet mode only reports the keys that failed
+            return response.get('Errors', [])
+        
+        batches = [s3_keys[i:i + 1000] for i in range(0, len(s3_keys), 1000)]
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(delete_batch, batch) for batch in batches),
+            return_exceptions=True
+        )
+        
+        errors = []
+        for batch, outcome in zip(batches, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Failed to delete {len(batch)} recordings: {outcome}")
+                errors.extend({"Key": key, "Message": str(outcome)} for key in batch)
+            else:
+                errors.extend(outcome)
+        
+        for error in errors:
+            logger.error(f"Failed to delete recording {error.get('Key')}: {error.get('Message')}")
+        
+        deleted = len(s3_keys) - len(errors)
+        logger.info(f"Successfully deleted {deleted} recordings")
+        return {"deleted": deleted, "errors": errors}
+    
+    async def delete_recording(self, s3_key: str) -> bool:
+        """Delete recording from S3"""
+        result = await self.delete_recordings([s3_key])
+        return not result["errors"]
     
     def get_bucket_info(self) -> Dict[str, Any]:
         """Get S3 bucket configuration information"""
@@ -211,4 +383,7 @@ class S3Service:
             "region": self.aws_region,
             "client_configured": self.s3_client is not None,
             "credentials_configured": bool(self.aws_access_key and self.aws_secret_key)
-        } 
\ No newline at end of file
+        }
+
+# Shared instance so the app reuses one pooled S3 client
+s3_service = S3Service()
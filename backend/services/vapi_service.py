@@ -1,16 +1,246 @@
 import os
 import httpx
+import orjson
 import asyncio
-from typing import Dict, Any, Optional
+import time
+import random
+from typing import Dict, Any, Optional, Union, ClassVar, Callable, List, Tuple
+from collections import defaultdict
+from functools import lru_cache
+from dataclasses import dataclass, asdict
 from loguru import logger
 import re
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone, timedelta
 from dateutil import parser
 import pytz
 
+# Strips formatting from phone numbers in a single C-level pass
+_NON_DIGIT_RE = re.compile(r'\D+')
+
+# str.translate table deleting every non-digit ASCII character
+_DELETE_NON_DIGITS = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+# Area code -> timezone, built once at import for is_valid_call_time (enhanced mapping for US)
+_AREA_CODE_TIMEZONES = {
+    # Eastern Time
+    "201": "US/Eastern", "202": "US/Eastern", "203": "US/Eastern",
+    "212": "US/Eastern", "215": "US/Eastern", "216": "US/Eastern",
+    "240": "US/Eastern", "267": "US/Eastern", "301": "US/Eastern",
+    "302": "US/Eastern", "304": "US/Eastern", "305": "US/Eastern",
+    "321": "US/Eastern", "347": "US/Eastern", "352": "US/Eastern",
+    "386": "US/Eastern", "401": "US/Eastern", "404": "US/Eastern",
+    "407": "US/Eastern", "410": "US/Eastern", "412": "US/Eastern",
+    "413": "US/Eastern", "434": "US/Eastern", "443": "US/Eastern",
+    "470": "US/Eastern", "475": "US/Eastern", "478": "US/Eastern",
+    "484": "US/Eastern", "508": "US/Eastern", "516": "US/Eastern",
+    "518": "US/Eastern", "561": "US/Eastern", "570": "US/Eastern",
+    "585": "US/Eastern", "607": "US/Eastern", "610": "US/Eastern",
+    "617": "US/Eastern", "646": "US/Eastern", "678": "US/Eastern",
+    "681": "US/Eastern", "689": "US/Eastern", "703": "US/Eastern",
+    "704": "US/Eastern", "706": "US/Eastern", "717": "US/Eastern",
+    "718": "US/Eastern", "724": "US/Eastern", "727": "US/Eastern",
+    "732": "US/Eastern", "734": "US/Eastern", "740": "US/Eastern",
+    "754": "US/Eastern", "757": "US/Eastern", "762": "US/Eastern",
+    "772": "US/Eastern", "774": "US/Eastern", "781": "US/Eastern",
+    "786": "US/Eastern", "787": "US/Eastern", "803": "US/Eastern",
+    "813": "US/Eastern", "828": "US/Eastern", "843": "US/Eastern",
+    "845": "US/Eastern", "848": "US/Eastern", "850": "US/Eastern",
+    "856": "US/Eastern", "857": "US/Eastern", "859": "US/Eastern",
+    "860": "US/Eastern", "863": "US/Eastern", "865": "US/Eastern",
+    "878": "US/Eastern", "904": "US/Eastern", "908": "US/Eastern",
+    "910": "US/Eastern", "912": "US/Eastern", "914": "US/Eastern",
+    "917": "US/Eastern", "919": "US/Eastern", "929": "US/Eastern",
+    "934": "US/Eastern", "937": "US/Eastern", "941": "US/Eastern",
+    "947": "US/Eastern", "954": "US/Eastern", "959": "US/Eastern",
+    "970": "US/Eastern", "973": "US/Eastern", "978": "US/Eastern",
+    "980": "US/Eastern", "984": "US/Eastern",
+    
+    # Central Time
+    "205": "US/Central", "214": "US/Central", "217": "US/Central",
+    "218": "US/Central", "224": "US/Central", "225": "US/Central",
+    "228": "US/Central", "251": "US/Central", "254": "US/Central",
+    "256": "US/Central", "260": "US/Central", "262": "US/Central",
+    "281": "US/Central", "309": "US/Central", "312": "US/Central",
+    "314": "US/Central", "316": "US/Central", "318": "US/Central",
+    "319": "US/Central", "320": "US/Central", "334": "US/Central",
+    "337": "US/Central", "361": "US/Central", "409": "US/Central",
+    "414": "US/Central", "417": "US/Central", "430": "US/Central",
+    "432": "US/Central", "469": "US/Central", "479": "US/Central",
+    "501": "US/Central", "502": "US/Central", "504": "US/Central",
+    "507": "US/Central", "512": "US/Central", "515": "US/Central",
+    "563": "US/Central", "573": "US/Central", "580": "US/Central",
+    "601": "US/Central", "608": "US/Central", "612": "US/Central",
+    "618": "US/Central", "620": "US/Central", "630": "US/Central",
+    "636": "US/Central", "641": "US/Central", "651": "US/Central",
+    "660": "US/Central", "662": "US/Central", "682": "US/Central",
+    "708": "US/Central", "712": "US/Central", "713": "US/Central",
+    "715": "US/Central", "731": "US/Central", "737": "US/Central",
+    "763": "US/Central", "769": "US/Central", "773": "US/Central",
+    "779": "US/Central", "785": "US/Central", "806": "US/Central",
+    "807": "US/Central", "815": "US/Central", "816": "US/Central",
+    "817": "US/Central", "830": "US/Central", "832": "US/Central",
+    "847": "US/Central", "870": "US/Central", "901": "US/Central",
+    "903": "US/Central", "913": "US/Central", "915": "US/Central",
+    "918": "US/Central", "920": "US/Central", "936": "US/Central",
+    "940": "US/Central", "952": "US/Central", "956": "US/Central",
+    "972": "US/Central", "979": "US/Central", "985": "US/Central",
+    
+    # Mountain Time (excluding Arizona)
+    "303": "US/Mountain", "307": "US/Mountain", "385": "US/Mountain",
+    "406": "US/Mountain", "435": "US/Mountain", "505": "US/Mountain",
+    "575": "US/Mountain", "719": "US/Mountain", "720": "US/Mountain",
+    "801": "US/Mountain",
+    
+    # Arizona (Mountain Standard Time year-round, no DST)
+    "480": "US/Arizona", "520": "US/Arizona", "602": "US/Arizona",
+    "623": "US/Arizona", "928": "US/Arizona",
+    
+    # Pacific Time
+    "206": "US/Pacific", "209": "US/Pacific", "213": "US/Pacific",
+    "253": "US/Pacific", "310": "US/Pacific", "323": "US/Pacific",
+    "341": "US/Pacific", "360": "US/Pacific", "415": "US/Pacific",
+    "424": "US/Pacific", "442": "US/Pacific", "510": "US/Pacific",
+    "530": "US/Pacific", "541": "US/Pacific", "559": "US/Pacific",
+    "562": "US/Pacific", "619": "US/Pacific", "626": "US/Pacific",
+    "628": "US/Pacific", "650": "US/Pacific", "657": "US/Pacific",
+    "661": "US/Pacific", "669": "US/Pacific", "707": "US/Pacific",
+    "714": "US/Pacific", "747": "US/Pacific", "760": "US/Pacific",
+    "805": "US/Pacific", "818": "US/Pacific", "831": "US/Pacific",
+    "858": "US/Pacific", "909": "US/Pacific", "916": "US/Pacific",
+    "925": "US/Pacific", "949": "US/Pacific", "951": "US/Pacific"
+}
+
+# tzinfo objects for every zone above, so calls skip the pytz registry lookup
+_TZ_CACHE = {name: pytz.timezone(name) for name in set(_AREA_CODE_TIMEZONES.values()) | {"US/Eastern"}}
+
+# (zone name, tzinfo) indexed by int(area code); area codes are 3 digits, so 1000
+# slots cover every key and unmapped codes default to Eastern without hashing
+_AREA_CODE_TZ_TABLE = [("US/Eastern", _TZ_CACHE["US/Eastern"])] * 1000
+for _area_code, _tz_name in _AREA_CODE_TIMEZONES.items():
+    _AREA_CODE_TZ_TABLE[int(_area_code)] = (_tz_name, _TZ_CACHE[_tz_name])
+del _area_code, _tz_name
+
+# TCPA compliant calling hours: 8 AM to 9 PM local time
+# For testing/debugging, we can extend to 6 AM to 11 PM
+_CALL_HOUR_MIN = 8  # 8 AM
+_CALL_HOUR_MAX = 21  # 9 PM (21:00)
+
+# Zone name -> (UTC date, 24-byte mask); mask[h] is 1 when UTC hour h of that day
+# falls inside calling hours in the zone, so a check is a single byte lookup
+_CALL_HOUR_MASKS: Dict[str, Tuple[date, bytes]] = {}
+
+# Zone name -> (wall-clock minute, allowed); the answer can only change on an hour
+# boundary, so checks within the same minute reuse it without touching datetime
+_CALL_TIME_CACHE: Dict[str, Tuple[int, bool]] = {}
+
+def _call_hour_mask(tz_name: str, local_tz: pytz.BaseTzInfo, utc_date: date) -> bytes:
+    """Calling-hours mask for a zone over one UTC day, rebuilt when the day changes"""
+    cached = _CALL_HOUR_MASKS.get(tz_name)
+    if cached is None or cached[0] != utc_date:
+        day_start = datetime(utc_date.year, utc_date.month, utc_date.day, tzinfo=timezone.utc)
+        mask = bytes(_CALL_HOUR_MIN <= (day_start + timedelta(hours=h)).astimezone(local_tz).hour < _CALL_HOUR_MAX
+                     for h in range(24))
+        cached = _CALL_HOUR_MASKS[tz_name] = (utc_date, mask)
+    return cached[1]
+
+@lru_cache(maxsize=4096)
+def _format_e164(phone: str) -> str:
+    """E.164 form of a raw phone string; pure, so retried and duplicate numbers hit the cache"""
+    # Remove all non-digit characters
+    digits_only = phone.translate(_DELETE_NON_DIGITS)
+    if not digits_only.isascii():
+        digits_only = _NON_DIGIT_RE.sub('', digits_only)
+    
+    # Always ensure US numbers have a "1" prefix; keep "+" numbers of other lengths as is
+    n = len(digits_only)
+    if n == 10:
+        return "+1" + digits_only
+    if n == 11:
+        return "+" + digits_only if digits_only[0] == "1" else "+1" + digits_only
+    if phone.startswith('+'):
+        return phone
+    return "+1" + digits_only
+
+@lru_cache(maxsize=4096)
+def _timezone_for_phone(phone_number: str) -> Optional[Tuple[str, str, pytz.BaseTzInfo]]:
+    """(area code, zone name, tzinfo) for a raw phone string, or None without 10 digits"""
+    # Fewer than 10 characters can't hold 10 digits, so skip the regex
+    if len(phone_number) < 10:
+        return None
+    phone_digits = phone_number.translate(_DELETE_NON_DIGITS)
+    if not phone_digits.isascii():
+        phone_digits = _NON_DIGIT_RE.sub('', phone_digits)
+    if len(phone_digits) < 10:
+        return None
+    area_code = phone_digits[-10:-7]  # Get first 3 digits of 10-digit number
+    tz_name, local_tz = _AREA_CODE_TZ_TABLE[int(area_code)]
+    return area_code, tz_name, local_tz
+
+# POST /call responses that mean the call was not placed and is safe to resend
+_CALL_RETRY_STATUSES = frozenset({429, 503})
+_CALL_MAX_ATTEMPTS = 3
+
+@dataclass(slots=True)
+class Customer:
+    number: str
+
+@dataclass(slots=True)
+class LeadData:
+    """Lead fields forwarded to the assistant as call context"""
+    first_name: str = ""
+    last_name: str = ""
+    email: str = ""
+    phone: str = ""
+    address: str = ""
+    city: str = ""
+    state: str = ""
+    zip_code: str = ""
+    
+    @classmethod
+    def from_lead(cls, lead) -> "LeadData":
+        """Build from a Lead row, mapping NULL columns to empty strings"""
+        return cls(
+            first_name=lead.first_name or "",
+            last_name=lead.last_name or "",
+            email=lead.email or "",
+            phone=lead.phone1 or "",
+            address=lead.address or "",
+            city=lead.city or "",
+            state=lead.state or "",
+            zip_code=lead.zip_code or ""
+        )
+
+@dataclass(slots=True)
+class CallData:
+    """Fixed-layout outbound call request passed to make_outbound_call"""
+    assistant_id: str
+    customer: Customer
+    lead_data: LeadData
+
 class VAPIService:
     """Service for interacting with VAPI for voice calls"""
     
+    # One long-lived instance per process; slots keep its attribute reads off a __dict__
+    __slots__ = (
+        "api_key", "base_url", "assistant_id", "phone_number_id", "phone_number", "headers",
+        "_caller_fields", "_client", "_call_slots", "_call_interval", "_pace_lock",
+        "_next_call_at"
+    )
+    
+    # Local hours calls may start in: CALL_HOUR_MIN <= hour < CALL_HOUR_MAX (TCPA)
+    CALL_HOUR_MIN: ClassVar[int] = _CALL_HOUR_MIN
+    CALL_HOUR_MAX: ClassVar[int] = _CALL_HOUR_MAX
+    
+    _FIRST_MESSAGE_TEMPLATE: ClassVar[Callable[[Dict[str, Any]], str]] = """Hi {first_name}, this is Zoe from Eluminus. I'm calling to confirm some information we have on file for you and see if you're still interested in our services. 
+
+I have your information as:
+- Name: {first_name} {last_name}
+- Email: {email}
+- Phone: {phone}
+- Address: {address}, {city}, {state} {zip_code}
+
+Is this information still correct? And are you still interested in learning more about our services?""".format_map
+    
     def __init__(self):
         self.api_key = os.getenv("VAPI_API_KEY")
         if not self.api_key:
@@ -31,106 +261,91 @@ class VAPIService:
         else:
             logger.warning("No VAPI phone number configured - outbound calls may fail")
         
+        # Caller fields shared by every outbound call payload, None when unconfigured
+        if self.phone_number_id:
+            self._caller_fields: Optional[Dict[str, str]] = {"phoneNumberId": self.phone_number_id}
+        elif self.phone_number:
+            self._caller_fields = {"phoneNumber": self.phone_number}
+        else:
+            self._caller_fields = None
+        
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
         
-        # Call time settings for TCPA compliance
-        self.min_call_hour = 9  # 9:00 AM
-        self.max_call_hour = 18  # 6:00 PM (18:00)
+        # Shared keep-alive HTTP/2 client, created on first request
+        self._client: Optional[httpx.AsyncClient] = None
         
-        # US time zones mapping
-        self.us_timezones = {
-            "Eastern": "US/Eastern",
-            "Central": "US/Central", 
-            "Mountain": "US/Mountain",
-            "Pacific": "US/Pacific",
-            "Alaska": "US/Alaska",
-            "Hawaii": "US/Hawaii"
-        }
-        
-        # Area code to time zone mapping (simplified)
-        self.area_code_to_timezone = {
-            "Eastern": [
-                "201", "202", "203", "207", "212", "215", "216", "217", "218", "219",
-                "223", "224", "228", "229", "231", "234", "239", "240", "248", "251",
-                "252", "267", "269", "276", "301", "302", "304", "305", "313", "317", 
-                "321", "330", "336", "339", "351", "352", "401", "404", "410", "412",
-                "413", "419", "423", "434", "440", "443", "470", "475", "478", "484",
-                "502", "508", "513", "517", "518", "540", "551", "561", "567", "571",
-                "585", "586", "603", "607", "609", "610", "614", "616", "617", "631",
-                "646", "678", "704", "716", "717", "718", "724", "727", "732", "734",
-                "757", "770", "772", "781", "786", "810", "813", "814", "828", "843",
-                "845", "856", "859", "863", "864", "904", "908", "914", "919", "937",
-                "941", "954", "973", "978", "980"
-            ],
-            "Central": [
-                "205", "210", "214", "225", "254", "256", "262", "281", "309", "312", 
-                "314", "316", "318", "319", "320", "331", "334", "337", "361", "402",
-                "405", "409", "414", "417", "430", "432", "469", "479", "501", "504",
-                "507", "512", "515", "563", "573", "574", "601", "605", "608", "612",
-                "615", "618", "620", "630", "636", "641", "651", "660", "662", "682",
-                "708", "712", "713", "715", "731", "763", "769", "773", "785", "815",
-                "816", "817", "830", "832", "847", "870", "901", "903", "913", "915",
-                "918", "920", "925", "936", "940", "952", "956", "972", "979", "985"
-            ],
-            "Mountain": [
-                "303", "307", "385", "406", "435", "505", "575", "602", "623", "719",
-                "720", "801", "907", "915", "928", "970"
-            ],
-            "Pacific": [
-                "209", "213", "279", "310", "323", "408", "415", "424", "442", "503",
-                "510", "530", "541", "559", "562", "619", "626", "628", "650", "657",
-                "661", "669", "702", "707", "714", "725", "747", "760", "775", "805",
-                "818", "831", "858", "909", "916", "925", "949", "951", "971", "206",
-                "253", "360", "406", "425", "509", "509", "530"
-            ],
-            "Alaska": ["907"],
-            "Hawaii": ["808"]
-        }
-        
-        # Validate required configuration
-        if not self.api_key:
-            raise ValueError("VAPI_API_KEY environment variable is required")
+        # Caps on outbound call requests across every caller of this service
+        self._call_slots = asyncio.Semaphore(int(os.getenv("VAPI_MAX_CONCURRENCY", "16")))
+        self._call_interval = 1.0 / float(os.getenv("VAPI_CALLS_PER_SECOND", "5"))
+        self._pace_lock = asyncio.Lock()
+        self._next_call_at = 0.0
         
         # Check phone number configuration
         if not self.phone_number_id and not self.phone_number:
             logger.warning("Neither VAPI_PHONE_NUMBER_ID nor VAPI_PHONE_NUMBER is configured")
             logger.warning("Outbound calls will fail without a phone number configuration")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared VAPI client so calls reuse pooled TLS connections"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=60.0)
+            )
+        return self._client
+    
+    async def _pace_call(self):
+        """Space outbound call requests at least _call_interval seconds apart"""
+        async with self._pace_lock:
+            now = time.monotonic()
+            if self._next_call_at > now:
+                await asyncio.sleep(self._next_call_at - now)
+                now = self._next_call_at
+            self._next_call_at = now + self._call_interval
+    
+    async def _post_call(self, body: bytes) -> httpx.Response:
+        """POST /call, backing off and retrying when VAPI rate-limits or the connection never opens"""
+        for attempt in range(1, _CALL_MAX_ATTEMPTS + 1):
+            delay = min(30.0, 2.0 ** (attempt - 1)) + random.uniform(0, 1)
+            try:
+                async with self._call_slots:
+                    await self._pace_call()
+                    response = await self._get_client().post("/call", content=body)
+            except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+                if attempt == _CALL_MAX_ATTEMPTS:
+                    raise
+                logger.warning(f"VAPI call request failed to connect ({e!r}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in _CALL_RETRY_STATUSES or attempt == _CALL_MAX_ATTEMPTS:
+                    return response
+                # Honor Retry-After when VAPI sends it in seconds
+                try:
+                    delay = float(response.headers["Retry-After"])
+                except (KeyError, ValueError):
+                    pass
+                logger.warning(f"VAPI returned {response.status_code}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    async def aclose(self):
+        """Close the shared VAPI client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def _format_phone_number(self, phone: str) -> str:
         """Format phone number to E.164 format"""
         if not phone:
-            logger.error("Phone number is empty or None")
+            logger.debug("Phone number is empty or None")
             return ""
-            
-        # Log the original phone number for debugging
-        logger.info(f"Formatting phone number: '{phone}'")
-            
-        # Remove all non-digit characters
-        digits_only = re.sub(r'\D', '', phone)
-        logger.info(f"Digits only: '{digits_only}'")
         
-        # Always ensure US numbers have a "1" prefix
-        if len(digits_only) == 10:
-            # 10-digit US number without country code, add +1
-            formatted = f"+1{digits_only}"
-        elif len(digits_only) == 11:
-            if digits_only.startswith('1'):
-                # 11-digit with "1" prefix, add "+"
-                formatted = f"+{digits_only}"
-            else:
-                # 11-digit without "1" prefix, add "+1"
-                formatted = f"+1{digits_only}"
-        elif phone.startswith('+'):
-            # Already has "+" prefix, keep as is
-            formatted = phone
-        else:
-            # For any other format, ensure it has "+1" prefix
-            formatted = f"+1{digits_only}"
-            
-        logger.info(f"Formatted phone number: '{formatted}'")
+        formatted = _format_e164(phone)
+        logger.opt(lazy=True).debug("Formatted phone number: '{}' -> '{}'", lambda: phone, lambda: formatted)
         return formatted
     
     def _calculate_duration(self, started_at: str, ended_at: str) -> Optional[int]:
@@ -139,9 +354,14 @@ class VAPIService:
             if not started_at or not ended_at:
                 return None
             
-            # Parse ISO timestamp strings to datetime objects
-            start_time = parser.parse(started_at)
-            end_time = parser.parse(ended_at)
+            # Parse ISO timestamp strings to datetime objects; VAPI sends RFC 3339, so the
+            # C fromisoformat handles it and dateutil only covers anything unexpected
+            try:
+                start_time = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+                end_time = datetime.fromisoformat(ended_at.replace("Z", "+00:00"))
+            except ValueError:
+                start_time = parser.parse(started_at)
+                end_time = parser.parse(ended_at)
             
             # Calculate duration in seconds
             duration = (end_time - start_time).total_seconds()
@@ -150,140 +370,135 @@ class VAPIService:
             logger.warning(f"Could not calculate call duration: {str(e)}")
             return None
     
-    async def make_outbound_call(self, call_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def make_outbound_call(self, call_data: Union[CallData, Dict[str, Any]]) -> Dict[str, Any]:
         """Make an outbound call via VAPI API"""
-        logger.info(f"=== VAPI OUTBOUND CALL ATTEMPT ===")
-        logger.info(f"Target phone: {call_data.get('customer', {}).get('number')}")
-        logger.info(f"Assistant ID: {call_data.get('assistant_id')}")
+        if isinstance(call_data, CallData):
+            call_data = asdict(call_data)
         
         try:
-            # Ensure phone number is properly formatted
+            # Look up the target and assistant once for logging and the payload
             phone_number = call_data.get("customer", {}).get("number")
+            assistant_id = call_data.get("assistant_id", self.assistant_id)
+            logger.info(f"=== VAPI OUTBOUND CALL ATTEMPT === Target phone: {phone_number}, Assistant ID: {assistant_id}")
+            
+            # Ensure phone number is properly formatted
             if not phone_number:
                 error_msg = "No phone number provided"
                 logger.error(f"VAPI Error: {error_msg}")
                 return {"success": False, "error": error_msg}
                 
             formatted_phone = self._format_phone_number(phone_number)
-            logger.info(f"Phone number formatted: {phone_number} -> {formatted_phone}")
-            
-            # Prepare the VAPI call payload - DO NOT override assistant settings
-            payload = {
-                "assistantId": call_data.get("assistant_id", self.assistant_id),
-                "customer": {
-                    "number": formatted_phone
-                },
-                # Pass lead data for context but don't override the assistant prompt
-                "assistantOverrides": {
-                    "variableValues": {
-                        "leadData": call_data.get("lead_data", {})
-                    }
-                }
-            }
             
             # Add phone number configuration for outbound calling
-            if self.phone_number_id:
-                payload["phoneNumberId"] = self.phone_number_id
-                logger.info(f"Using phoneNumberId: {self.phone_number_id}")
-            elif self.phone_number:
-                payload["phoneNumber"] = self.phone_number
-                logger.info(f"Using phoneNumber: {self.phone_number}")
-            else:
+            if self._caller_fields is None:
                 error_msg = "No VAPI phone number configured (need VAPI_PHONE_NUMBER_ID or VAPI_PHONE_NUMBER)"
                 logger.error(f"VAPI Error: {error_msg}")
                 return {"success": False, "error": error_msg}
             
-            logger.info(f"VAPI Call Payload: {payload}")
+            # Prepare the VAPI call payload - DO NOT override assistant settings
+            payload = {
+                **self._caller_fields,
+                "assistantId": assistant_id,
+                "customer": {"number": formatted_phone}
+            }
+            
+            # Pass lead data for context but don't override the assistant prompt
+            lead_data = call_data.get("lead_data")
+            if lead_data:
+                payload["assistantOverrides"] = {"variableValues": {"leadData": lead_data}}
+            
+            logger.opt(lazy=True).debug("VAPI Call Payload: {}", lambda: payload)
             
             # Make the API call to VAPI
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                logger.info("Making HTTP request to VAPI...")
-                response = await client.post(
-                    f"{self.base_url}/call",
-                    headers=self.headers,
-                    json=payload
-                )
+            logger.debug("Making HTTP request to VAPI...")
+            # orjson encodes the lead payload in C; the client already sends the JSON Content-Type
+            response = await self._post_call(orjson.dumps(payload))
+            
+            logger.opt(lazy=True).debug("VAPI Response Status: {}", lambda: response.status_code)
+            logger.opt(lazy=True).debug("VAPI Response Headers: {}", lambda: dict(response.headers))
+            
+            # Parse response
+            if response.status_code == 201:
+                # Success
+                response_data = orjson.loads(response.content)
+                call_id = response_data.get("id")
                 
-                logger.info(f"VAPI Response Status: {response.status_code}")
-                logger.info(f"VAPI Response Headers: {dict(response.headers)}")
+                logger.info(f"VAPI Call SUCCESS - Call ID: {call_id}")
+                logger.opt(lazy=True).debug("Full VAPI Response: {}", lambda: response_data)
+                
+                return {
+                    "success": True,
+                    "call_id": call_id,
+                    "vapi_response": response_data,
+                    "formatted_phone": formatted_phone
+                }
+                
+            else:
+                # Error from VAPI
+                try:
+                    error_data = orjson.loads(response.content)
+                    error_msg = error_data.get("message", f"HTTP {response.status_code}")
+                except:
+                    error_msg = f"HTTP {response.status_code}: {response.text}"
+                
+                logger.error(f"VAPI Call FAILED - Status: {response.status_code}")
+                logger.error(f"VAPI Error: {error_msg}")
+                logger.error(f"VAPI Response Text: {response.text}")
+                
+                return {
+                    "success": False,
+                    "error": error_msg,
+                    "status_code": response.status_code,
+                    "response_text": response.text
+                }
                 
-                # Parse response
-                if response.status_code == 201:
-                    # Success
-                    response_data = response.json()
-                    call_id = response_data.get("id")
-                    
-                    logger.info(f"VAPI Call SUCCESS - Call ID: {call_id}")
-                    logger.info(f"Full VAPI Response: {response_data}")
-                    
-                    return {
-                        "success": True,
-                        "call_id": call_id,
-                        "vapi_response": response_data,
-                        "formatted_phone": formatted_phone
-                    }
-                    
-                else:
-                    # Error from VAPI
-                    try:
-                        error_data = response.json()
-                        error_msg = error_data.get("message", f"HTTP {response.status_code}")
-                    except:
-                        error_msg = f"HTTP {response.status_code}: {response.text}"
-                    
-                    logger.error(f"VAPI Call FAILED - Status: {response.status_code}")
-                    logger.error(f"VAPI Error: {error_msg}")
-                    logger.error(f"VAPI Response Text: {response.text}")
-                    
-                    return {
-                        "success": False,
-                        "error": error_msg,
-                        "status_code": response.status_code,
-                        "response_text": response.text
-                    }
-                    
-        except httpx.TimeoutException:
-            error_msg = "VAPI request timeout"
-            logger.error(f"VAPI Error: {error_msg}")
-            return {"success": False, "error": error_msg}
-            
-        except httpx.RequestError as e:
-            error_msg = f"VAPI request error: {str(e)}"
-            logger.error(f"VAPI Error: {error_msg}")
-            return {"success": False, "error": error_msg}
-                    
         except Exception as e:
-            error_msg = f"Unexpected error in VAPI call: {str(e)}"
+            # Timeouts subclass RequestError, so check them first
+            if isinstance(e, httpx.TimeoutException):
+                error_msg = "VAPI request timeout"
+            elif isinstance(e, httpx.RequestError):
+                error_msg = f"VAPI request error: {str(e)}"
+            else:
+                error_msg = f"Unexpected error in VAPI call: {str(e)}"
             logger.error(f"VAPI Error: {error_msg}")
             return {"success": False, "error": error_msg}
     
+    async def make_outbound_calls_batch(self, calls: List[Union[CallData, Dict[str, Any]]],
+                                        concurrency: int = 20) -> List[Union[Dict[str, Any], BaseException]]:
+        """Place several outbound calls concurrently, at most `concurrency` requests in flight"""
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def place_call(call_data: Union[CallData, Dict[str, Any]]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.make_outbound_call(call_data)
+        
+        # Results line up with calls; anything make_outbound_call doesn't catch itself
+        # (e.g. malformed call data) comes back as the exception instead of losing the batch
+        return await asyncio.gather(*(place_call(call_data) for call_data in calls), return_exceptions=True)
+    
     async def get_call_status(self, call_id: str) -> Dict[str, Any]:
         """Get the status of a VAPI call"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/call/{call_id}",
-                    headers=self.headers
-                )
+            response = await self._get_client().get(f"/call/{call_id}", timeout=10.0)
+            
+            if response.status_code == 200:
+                call_data = orjson.loads(response.content)
+                return {
+                    "success": True,
+                    "status": call_data.get("status"),
+                    "data": call_data,
+                    "duration": call_data.get("duration"),
+                    "recording_url": call_data.get("recordingUrl"),
+                    "transcript": call_data.get("transcript"),
+                    "analysis": call_data.get("analysis", {})
+                }
+            else:
+                logger.error(f"Failed to get call status: {response.status_code} - {response.text}")
+                return {
+                    "success": False,
+                    "error": f"HTTP {response.status_code}: {response.text}"
+                }
                 
-                if response.status_code == 200:
-                    call_data = response.json()
-                    return {
-                        "success": True,
-                        "status": call_data.get("status"),
-                        "data": call_data,
-                        "duration": call_data.get("duration"),
-                        "recording_url": call_data.get("recordingUrl"),
-                        "transcript": call_data.get("transcript"),
-                        "analysis": call_data.get("analysis", {})
-                    }
-                else:
-                    logger.error(f"Failed to get call status: {response.status_code} - {response.text}")
-                    return {
-                        "success": False,
-                        "error": f"HTTP {response.status_code}: {response.text}"
-                    }
-                    
         except Exception as e:
             logger.error(f"Error getting call status for {call_id}: {e}")
             return {"success": False, "error": str(e)}
@@ -291,9 +506,11 @@ class VAPIService:
     async def get_call_recording(self, call_id: str) -> Optional[str]:
         """Get the recording URL for a completed call"""
         try:
-            call_status = await self.get_call_status(call_id)
-            if call_status.get("success"):
-                return call_status.get("recording_url")
+            # Only recordingUrl is needed, so skip building the full get_call_status result
+            response = await self._get_client().get(f"/call/{call_id}", timeout=10.0)
+            if response.status_code == 200:
+                return orjson.loads(response.content).get("recordingUrl")
+            logger.error(f"Failed to get call recording: {response.status_code} - {response.text}")
             return None
         except Exception as e:
             logger.error(f"Error getting call recording: {str(e)}")
@@ -301,29 +518,12 @@ class VAPIService:
     
     def _generate_first_message(self, lead_data: Dict[str, Any]) -> str:
         """Generate the first message for Zoe based on lead data"""
-        first_name = lead_data.get("first_name", "")
-        
-        # Customize the first message based on lead data
-        message = f"""Hi {first_name}, this is Zoe from Eluminus. I'm calling to confirm some information we have on file for you and see if you're still interested in our services. 
-
-I have your information as:
-- Name: {lead_data.get('first_name', '')} {lead_data.get('last_name', '')}
-- Email: {lead_data.get('email', '')}
-- Phone: {lead_data.get('phone', '')}
-- Address: {lead_data.get('address', '')}, {lead_data.get('city', '')}, {lead_data.get('state', '')} {lead_data.get('zip_code', '')}
-
-Is this information still correct? And are you still interested in learning more about our services?"""
-        
-        return message
+        # Missing lead fields render as empty strings
+        return self._FIRST_MESSAGE_TEMPLATE(defaultdict(str, lead_data))
     
     async def update_assistant_instructions(self, instructions: str) -> bool:
         """Update the assistant instructions for better lead qualification"""
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             payload = {
                 "model": {
                     "provider": "openai",
@@ -337,15 +537,9 @@ Is this information still correct? And are you still interested in learning more
                 }
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.patch(
-                    f"{self.base_url}/assistant/{self.assistant_id}",
-                    headers=headers,
-                    json=payload,
-                    timeout=30.0
-                )
-                
-                return response.status_code == 200
+            response = await self._get_client().patch(f"/assistant/{self.assistant_id}", content=orjson.dumps(payload))
+            
+            return response.status_code == 200
                 
         except Exception as e:
             logger.error(f"Error updating assistant instructions: {str(e)}")
@@ -386,125 +580,40 @@ CALL FLOW:
 
 Remember to be natural and conversational while gathering this information efficiently."""
 
-    async def is_valid_call_time(self, phone_number: str) -> bool:
+    def get_phone_timezone(self, phone_number: str) -> Optional[Dict[str, Any]]:
+        """Area code, zone name and tzinfo used for a phone number's call-time check"""
+        tz_info = _timezone_for_phone(phone_number)
+        if tz_info is None:
+            return None
+        area_code, tz_name, local_tz = tz_info
+        return {"area_code": area_code, "timezone": tz_name, "tzinfo": local_tz}
+    
+    def is_valid_call_time(self, phone_number: str) -> bool:
         """Check if current time is valid for calling based on timezone"""
         try:
-            # Extract area code for timezone determination
-            phone_digits = ''.join(filter(str.isdigit, phone_number))
-            if len(phone_digits) >= 10:
-                area_code = phone_digits[-10:-7]  # Get first 3 digits of 10-digit number
+            # Area code and timezone, cached per raw phone string
+            tz_info = _timezone_for_phone(phone_number)
+            if tz_info is not None:
+                area_code, tz_name, local_tz = tz_info
                 
-                # Map area codes to timezones (enhanced mapping for US)
-                timezone_map = {
-                    # Eastern Time
-                    "201": "US/Eastern", "202": "US/Eastern", "203": "US/Eastern",
-                    "212": "US/Eastern", "215": "US/Eastern", "216": "US/Eastern",
-                    "240": "US/Eastern", "267": "US/Eastern", "301": "US/Eastern",
-                    "302": "US/Eastern", "304": "US/Eastern", "305": "US/Eastern",
-                    "321": "US/Eastern", "347": "US/Eastern", "352": "US/Eastern",
-                    "386": "US/Eastern", "401": "US/Eastern", "404": "US/Eastern",
-                    "407": "US/Eastern", "410": "US/Eastern", "412": "US/Eastern",
-                    "413": "US/Eastern", "434": "US/Eastern", "443": "US/Eastern",
-                    "470": "US/Eastern", "475": "US/Eastern", "478": "US/Eastern",
-                    "484": "US/Eastern", "508": "US/Eastern", "516": "US/Eastern",
-                    "518": "US/Eastern", "561": "US/Eastern", "570": "US/Eastern",
-                    "585": "US/Eastern", "607": "US/Eastern", "610": "US/Eastern",
-                    "617": "US/Eastern", "646": "US/Eastern", "678": "US/Eastern",
-                    "681": "US/Eastern", "689": "US/Eastern", "703": "US/Eastern",
-                    "704": "US/Eastern", "706": "US/Eastern", "717": "US/Eastern",
-                    "718": "US/Eastern", "724": "US/Eastern", "727": "US/Eastern",
-                    "732": "US/Eastern", "734": "US/Eastern", "740": "US/Eastern",
-                    "754": "US/Eastern", "757": "US/Eastern", "762": "US/Eastern",
-                    "772": "US/Eastern", "774": "US/Eastern", "781": "US/Eastern",
-                    "786": "US/Eastern", "787": "US/Eastern", "803": "US/Eastern",
-                    "813": "US/Eastern", "828": "US/Eastern", "843": "US/Eastern",
-                    "845": "US/Eastern", "848": "US/Eastern", "850": "US/Eastern",
-                    "856": "US/Eastern", "857": "US/Eastern", "859": "US/Eastern",
-                    "860": "US/Eastern", "863": "US/Eastern", "865": "US/Eastern",
-                    "878": "US/Eastern", "904": "US/Eastern", "908": "US/Eastern",
-                    "910": "US/Eastern", "912": "US/Eastern", "914": "US/Eastern",
-                    "917": "US/Eastern", "919": "US/Eastern", "929": "US/Eastern",
-                    "934": "US/Eastern", "937": "US/Eastern", "941": "US/Eastern",
-                    "947": "US/Eastern", "954": "US/Eastern", "959": "US/Eastern",
-                    "970": "US/Eastern", "973": "US/Eastern", "978": "US/Eastern",
-                    "980": "US/Eastern", "984": "US/Eastern", "985": "US/Eastern",
-                    
-                    # Central Time
-                    "205": "US/Central", "214": "US/Central", "217": "US/Central",
-                    "218": "US/Central", "224": "US/Central", "225": "US/Central",
-                    "228": "US/Central", "251": "US/Central", "254": "US/Central",
-                    "256": "US/Central", "260": "US/Central", "262": "US/Central",
-                    "281": "US/Central", "309": "US/Central", "312": "US/Central",
-                    "314": "US/Central", "316": "US/Central", "318": "US/Central",
-                    "319": "US/Central", "320": "US/Central", "334": "US/Central",
-                    "337": "US/Central", "361": "US/Central", "409": "US/Central",
-                    "414": "US/Central", "417": "US/Central", "430": "US/Central",
-                    "432": "US/Central", "469": "US/Central", "479": "US/Central",
-                    "501": "US/Central", "502": "US/Central", "504": "US/Central",
-                    "507": "US/Central", "512": "US/Central", "515": "US/Central",
-                    "563": "US/Central", "573": "US/Central", "580": "US/Central",
-                    "601": "US/Central", "608": "US/Central", "612": "US/Central",
-                    "618": "US/Central", "620": "US/Central", "630": "US/Central",
-                    "636": "US/Central", "641": "US/Central", "651": "US/Central",
-                    "660": "US/Central", "662": "US/Central", "682": "US/Central",
-                    "708": "US/Central", "712": "US/Central", "713": "US/Central",
-                    "715": "US/Central", "731": "US/Central", "737": "US/Central",
-                    "763": "US/Central", "769": "US/Central", "773": "US/Central",
-                    "779": "US/Central", "785": "US/Central", "806": "US/Central",
-                    "807": "US/Central", "815": "US/Central", "816": "US/Central",
-                    "817": "US/Central", "830": "US/Central", "832": "US/Central",
-                    "847": "US/Central", "870": "US/Central", "901": "US/Central",
-                    "903": "US/Central", "913": "US/Central", "915": "US/Central",
-                    "918": "US/Central", "920": "US/Central", "936": "US/Central",
-                    "940": "US/Central", "952": "US/Central", "956": "US/Central",
-                    "972": "US/Central", "979": "US/Central", "985": "US/Central",
-                    
-                    # Mountain Time (excluding Arizona)
-                    "303": "US/Mountain", "307": "US/Mountain", "385": "US/Mountain",
-                    "406": "US/Mountain", "435": "US/Mountain", "505": "US/Mountain",
-                    "575": "US/Mountain", "719": "US/Mountain", "720": "US/Mountain",
-                    "801": "US/Mountain",
-                    
-                    # Arizona (Mountain Standard Time year-round, no DST)
-                    "480": "US/Arizona", "520": "US/Arizona", "602": "US/Arizona",
-                    "623": "US/Arizona", "928": "US/Arizona",
-                    
-                    # Pacific Time
-                    "206": "US/Pacific", "209": "US/Pacific", "213": "US/Pacific",
-                    "253": "US/Pacific", "310": "US/Pacific", "323": "US/Pacific",
-                    "341": "US/Pacific", "360": "US/Pacific", "415": "US/Pacific",
-                    "424": "US/Pacific", "442": "US/Pacific", "510": "US/Pacific",
-                    "530": "US/Pacific", "541": "US/Pacific", "559": "US/Pacific",
-                    "562": "US/Pacific", "619": "US/Pacific", "626": "US/Pacific",
-                    "628": "US/Pacific", "650": "US/Pacific", "657": "US/Pacific",
-                    "661": "US/Pacific", "669": "US/Pacific", "707": "US/Pacific",
-                    "714": "US/Pacific", "747": "US/Pacific", "760": "US/Pacific",
-                    "805": "US/Pacific", "818": "US/Pacific", "831": "US/Pacific",
-                    "858": "US/Pacific", "909": "US/Pacific", "916": "US/Pacific",
-                    "925": "US/Pacific", "949": "US/Pacific", "951": "US/Pacific"
-                }
+                # Look up the current UTC hour in the zone's calling-hours mask, once per minute
+                now = time.time()
+                minute = int(now // 60)
+                cached = _CALL_TIME_CACHE.get(tz_name)
+                if cached is None or cached[0] != minute:
+                    utc_now = datetime.fromtimestamp(now, timezone.utc)
+                    allowed = bool(_call_hour_mask(tz_name, local_tz, utc_now.date())[utc_now.hour])
+                    cached = _CALL_TIME_CACHE[tz_name] = (minute, allowed)
                 
-                # Get timezone for area code
-                tz_name = timezone_map.get(area_code, "US/Eastern")  # Default to Eastern
-                local_tz = pytz.timezone(tz_name)
-                
-                # Get current time in local timezone
-                utc_now = datetime.now(timezone.utc)
-                local_time = utc_now.astimezone(local_tz)
-                current_hour = local_time.hour
-                
-                # TCPA compliant calling hours: 8 AM to 9 PM local time
-                # For testing/debugging, we can extend to 6 AM to 11 PM
-                min_hour = 8  # 8 AM
-                max_hour = 21  # 9 PM (21:00)
-                
-                if min_hour <= current_hour < max_hour:
-                    logger.debug(f"Valid call time for {phone_number} (area code {area_code}, {tz_name}): "
-                               f"{local_time.strftime('%I:%M %p %Z')} - ALLOWED")
+                if cached[1]:
+                    logger.opt(lazy=True).debug("Valid call time for {} (area code {}, {}): {} - ALLOWED",
+                                                lambda: phone_number, lambda: area_code, lambda: tz_name,
+                                                lambda: datetime.fromtimestamp(now, local_tz).strftime('%I:%M %p %Z'))
                     return True
                 else:
+                    local_time = datetime.fromtimestamp(now, local_tz)
                     logger.warning(f"Invalid call time for {phone_number} (area code {area_code}, {tz_name}): "
-                                 f"{local_time.strftime('%I:%M %p %Z')} - outside {min_hour}:00 AM to {max_hour}:00 PM")
+                                 f"{local_time.strftime('%I:%M %p %Z')} - outside {_CALL_HOUR_MIN}:00 AM to {_CALL_HOUR_MAX}:00 PM")
                     return False
                     
             else:
@@ -518,21 +627,17 @@ Remember to be natural and conversational while gathering this information effic
     async def get_assistant_info(self) -> Dict[str, Any]:
         """Get information about the configured assistant"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    f"{self.base_url}/assistant/{self.assistant_id}",
-                    headers=self.headers
-                )
+            response = await self._get_client().get(f"/assistant/{self.assistant_id}", timeout=10.0)
+            
+            if response.status_code == 200:
+                assistant_data = orjson.loads(response.content)
+                logger.info(f"Assistant Info: {assistant_data.get('name', 'Unknown')} - "
+                          f"Model: {assistant_data.get('model', {}).get('model', 'Unknown')}")
+                return {"success": True, "data": assistant_data}
+            else:
+                logger.error(f"Failed to get assistant info: {response.status_code}")
+                return {"success": False, "error": f"HTTP {response.status_code}"}
                 
-                if response.status_code == 200:
-                    assistant_data = response.json()
-                    logger.info(f"Assistant Info: {assistant_data.get('name', 'Unknown')} - "
-                              f"Model: {assistant_data.get('model', {}).get('model', 'Unknown')}")
-                    return {"success": True, "data": assistant_data}
-                else:
-                    logger.error(f"Failed to get assistant info: {response.status_code}")
-                    return {"success": False, "error": f"HTTP {response.status_code}"}
-                    
         except Exception as e:
             logger.error(f"Error getting assistant info: {e}")
             return {"success": False, "error": str(e)}
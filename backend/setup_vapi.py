@@ -7,96 +7,164 @@ This script helps you configure VAPI properly for the Multi-Agent AI Workflow sy
 
 import os
 import asyncio
+import threading
 import httpx
+from types import MappingProxyType
+from typing import Awaitable, Optional
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Attempts per VAPI request when rate limited (HTTP 429)
+_MAX_ATTEMPTS = 3
+
+# VAPI list endpoints return a bare array capped at `limit` rows (default 100)
+_LIST_LIMIT = 1000
+
+# VAPI settings read once after .env is loaded
+_ENV = MappingProxyType({
+    key: os.getenv(key) for key in ("VAPI_API_KEY", "VAPI_PHONE_NUMBER_ID", "VAPI_ASSISTANT_ID")
+})
+
 class VAPISetupHelper:
     def __init__(self):
-        self.api_key = os.getenv("VAPI_API_KEY")
+        self.api_key = _ENV["VAPI_API_KEY"]
         self.base_url = "https://api.vapi.ai"
+        self.headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # Shared keep-alive client so menu actions reuse one TLS connection
+        self._client: Optional[httpx.AsyncClient] = None
+        
+        # Cap on concurrent VAPI requests from this helper
+        self._request_slots = asyncio.Semaphore(int(os.getenv("VAPI_MAX_CONCURRENCY", "8")))
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared VAPI client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=64)
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared VAPI client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
     
-    async def list_phone_numbers(self):
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send a VAPI request within the concurrency cap, backing off and retrying on 429"""
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            async with self._request_slots:
+                response = await self._get_client().request(method, path, **kwargs)
+            if response.status_code != 429 or attempt == _MAX_ATTEMPTS:
+                return response
+            # Honor Retry-After when VAPI sends it in seconds
+            try:
+                delay = float(response.headers["Retry-After"])
+            except (KeyError, ValueError):
+                delay = 2.0 ** (attempt - 1)
+            print(f"⏳ VAPI rate limit hit, retrying in {delay:.1f}s...")
+            await asyncio.sleep(delay)
+    
+    async def _fetch_phone_numbers(self) -> httpx.Response:
+        """GET the account's phone numbers"""
+        return await self._request("GET", "/phone-number", params={"limit": _LIST_LIMIT})
+    
+    async def list_phone_numbers(self, pending: Optional[Awaitable[httpx.Response]] = None):
         """List available phone numbers in your VAPI account"""
         if not self.api_key:
             print("❌ VAPI_API_KEY not found in .env file")
             return
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+            # Await a request already started by list_all, or fetch now
+            response = await (pending if pending is not None else self._fetch_phone_numbers())
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/phone-number",
-                    headers=headers,
-                    timeout=30.0
-                )
+            if response.status_code == 200:
+                phone_numbers = response.json()
+                print("📞 Available Phone Numbers:")
+                print("-" * 50)
+                for phone in phone_numbers:
+                    print(f"ID: {phone.get('id')}")
+                    print(f"Number: {phone.get('number')}")
+                    print(f"Provider: {phone.get('provider')}")
+                    print("-" * 30)
                 
-                if response.status_code == 200:
-                    phone_numbers = response.json()
-                    print("📞 Available Phone Numbers:")
-                    print("-" * 50)
-                    for phone in phone_numbers:
-                        print(f"ID: {phone.get('id')}")
-                        print(f"Number: {phone.get('number')}")
-                        print(f"Provider: {phone.get('provider')}")
-                        print("-" * 30)
-                    
-                    if phone_numbers:
-                        print(f"\n✅ Use this in your .env file:")
-                        print(f"VAPI_PHONE_NUMBER_ID={phone_numbers[0].get('id')}")
-                    else:
-                        print("❌ No phone numbers found. Please purchase a phone number in your VAPI dashboard.")
+                if phone_numbers:
+                    print(f"\n✅ Use this in your .env file:")
+                    print(f"VAPI_PHONE_NUMBER_ID={phone_numbers[0].get('id')}")
+                    if len(phone_numbers) >= _LIST_LIMIT:
+                        print(f"⚠️ Showing the first {_LIST_LIMIT} phone numbers only")
                 else:
-                    print(f"❌ Failed to fetch phone numbers: {response.status_code} - {response.text}")
-                    
+                    print("❌ No phone numbers found. Please purchase a phone number in your VAPI dashboard.")
+            else:
+                print(f"❌ Failed to fetch phone numbers: {response.status_code} - {response.text}")
+                
         except Exception as e:
             print(f"❌ Error fetching phone numbers: {e}")
     
-    async def list_assistants(self):
+    async def _fetch_assistants(self) -> httpx.Response:
+        """GET the account's assistants"""
+        return await self._request("GET", "/assistant", params={"limit": _LIST_LIMIT})
+    
+    async def list_assistants(self, pending: Optional[Awaitable[httpx.Response]] = None):
         """List available assistants in your VAPI account"""
         if not self.api_key:
             print("❌ VAPI_API_KEY not found in .env file")
             return
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+            # Await a request already started by list_all, or fetch now
+            response = await (pending if pending is not None else self._fetch_assistants())
             
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/assistant",
-                    headers=headers,
-                    timeout=30.0
-                )
+            if response.status_code == 200:
+                assistants = response.json()
+                print("🤖 Available Assistants:")
+                print("-" * 50)
+                for assistant in assistants:
+                    print(f"ID: {assistant.get('id')}")
+                    print(f"Name: {assistant.get('name', 'Unnamed')}")
+                    print(f"Model: {assistant.get('model', {}).get('model', 'Unknown')}")
+                    print("-" * 30)
                 
-                if response.status_code == 200:
-                    assistants = response.json()
-                    print("🤖 Available Assistants:")
-                    print("-" * 50)
-                    for assistant in assistants:
-                        print(f"ID: {assistant.get('id')}")
-                        print(f"Name: {assistant.get('name', 'Unnamed')}")
-                        print(f"Model: {assistant.get('model', {}).get('model', 'Unknown')}")
-                        print("-" * 30)
-                    
-                    if assistants:
-                        print(f"\n✅ Use this in your .env file:")
-                        print(f"VAPI_ASSISTANT_ID={assistants[0].get('id')}")
-                    else:
-                        print("❌ No assistants found. Please create an assistant in your VAPI dashboard.")
+                if assistants:
+                    print(f"\n✅ Use this in your .env file:")
+                    print(f"VAPI_ASSISTANT_ID={assistants[0].get('id')}")
+                    if len(assistants) >= _LIST_LIMIT:
+                        print(f"⚠️ Showing the first {_LIST_LIMIT} assistants only")
                 else:
-                    print(f"❌ Failed to fetch assistants: {response.status_code} - {response.text}")
-                    
+                    print("❌ No assistants found. Please create an assistant in your VAPI dashboard.")
+            else:
+                print(f"❌ Failed to fetch assistants: {response.status_code} - {response.text}")
+                
         except Exception as e:
             print(f"❌ Error fetching assistants: {e}")
     
+    async def list_all(self):
+        """List phone numbers and assistants with both requests in flight at once"""
+        if not self.api_key:
+            print("❌ VAPI_API_KEY not found in .env file")
+            return
+        
+        phone_numbers = asyncio.ensure_future(self._fetch_phone_numbers())
+        assistants = asyncio.ensure_future(self._fetch_assistants())
+        await self.list_phone_numbers(phone_numbers)
+        print()
+        await self.list_assistants(assistants)
+    
     async def create_zoe_assistant(self):
         """Create the Zoe assistant for lead qualification"""
         if not self.api_key:
@@ -104,11 +172,6 @@ class VAPISetupHelper:
             return
         
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-            
             assistant_config = {
                 "name": "Zoe - Lead Qualification Assistant",
                 "model": {
@@ -162,25 +225,19 @@ Remember to be natural and conversational while gathering this information effic
                 "maxDurationSeconds": 300  # 5 minutes max
             }
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/assistant",
-                    headers=headers,
-                    json=assistant_config,
-                    timeout=30.0
-                )
+            response = await self._request("POST", "/assistant", json=assistant_config)
+            
+            if response.status_code == 201:
+                assistant = response.json()
+                print("✅ Successfully created Zoe assistant!")
+                print(f"Assistant ID: {assistant.get('id')}")
+                print(f"\n✅ Add this to your .env file:")
+                print(f"VAPI_ASSISTANT_ID={assistant.get('id')}")
+                return assistant.get('id')
+            else:
+                print(f"❌ Failed to create assistant: {response.status_code} - {response.text}")
+                return None
                 
-                if response.status_code == 201:
-                    assistant = response.json()
-                    print("✅ Successfully created Zoe assistant!")
-                    print(f"Assistant ID: {assistant.get('id')}")
-                    print(f"\n✅ Add this to your .env file:")
-                    print(f"VAPI_ASSISTANT_ID={assistant.get('id')}")
-                    return assistant.get('id')
-                else:
-                    print(f"❌ Failed to create assistant: {response.status_code} - {response.text}")
-                    return None
-                    
         except Exception as e:
             print(f"❌ Error creating assistant: {e}")
             return None
@@ -198,14 +255,14 @@ Remember to be natural and conversational while gathering this information effic
             return
         
         # Check phone number ID
-        phone_number_id = os.getenv("VAPI_PHONE_NUMBER_ID")
+        phone_number_id = _ENV["VAPI_PHONE_NUMBER_ID"]
         if phone_number_id and phone_number_id != "your_vapi_phone_number_uuid_here":
             print("✅ VAPI_PHONE_NUMBER_ID is set")
         else:
             print("❌ VAPI_PHONE_NUMBER_ID is missing or not configured")
         
         # Check assistant ID
-        assistant_id = os.getenv("VAPI_ASSISTANT_ID")
+        assistant_id = _ENV["VAPI_ASSISTANT_ID"]
         if assistant_id and assistant_id != "your_vapi_assistant_uuid_here":
             print("✅ VAPI_ASSISTANT_ID is set")
         else:
@@ -213,35 +270,54 @@ Remember to be natural and conversational while gathering this information effic
         
         print("\n" + "=" * 50)
 
-async def main():
-    helper = VAPISetupHelper()
+async def _ainput(prompt: str) -> str:
+    """Read a line without blocking the event loop"""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
     
-    print("🚀 VAPI Configuration Setup Helper")
-    print("=" * 50)
+    def read():
+        try:
+            result = (future.set_result, input(prompt))
+        except BaseException as e:
+            result = (future.set_exception, e)
+        loop.call_soon_threadsafe(lambda: future.done() or result[0](result[1]))
     
-    while True:
-        print("\nWhat would you like to do?")
-        print("1. Test current configuration")
-        print("2. List available phone numbers")
-        print("3. List available assistants")
-        print("4. Create Zoe assistant")
-        print("5. Exit")
-        
-        choice = input("\nEnter your choice (1-5): ").strip()
+    # A daemon thread rather than asyncio.to_thread, whose executor would keep
+    # Ctrl+C waiting on stdin until Enter is pressed
+    threading.Thread(target=read, daemon=True).start()
+    return await future
+
+async def main():
+    async with VAPISetupHelper() as helper:
+        print("🚀 VAPI Configuration Setup Helper")
+        print("=" * 50)
         
-        if choice == "1":
-            await helper.test_configuration()
-        elif choice == "2":
-            await helper.list_phone_numbers()
-        elif choice == "3":
-            await helper.list_assistants()
-        elif choice == "4":
-            await helper.create_zoe_assistant()
-        elif choice == "5":
-            print("👋 Goodbye!")
-            break
-        else:
-            print("❌ Invalid choice. Please enter 1-5.")
+        while True:
+            print("\nWhat would you like to do?")
+            print("1. Test current configuration")
+            print("2. List available phone numbers")
+            print("3. List available assistants")
+            print("4. Create Zoe assistant")
+            print("5. List phone numbers and assistants")
+            print("6. Exit")
+            
+            choice = (await _ainput("\nEnter your choice (1-6): ")).strip()
+            
+            if choice == "1":
+                await helper.test_configuration()
+            elif choice == "2":
+                await helper.list_phone_numbers()
+            elif choice == "3":
+                await helper.list_assistants()
+            elif choice == "4":
+                await helper.create_zoe_assistant()
+            elif choice == "5":
+                await helper.list_all()
+            elif choice == "6":
+                print("👋 Goodbye!")
+                break
+            else:
+                print("❌ Invalid choice. Please enter 1-6.")
 
 if __name__ == "__main__":
     asyncio.run(main()) 
\ No newline at end of file
@@ -10,6 +10,14 @@ import signal
 import subprocess
 import time
 from datetime import datetime
+from typing import Optional
+
+import httpx
+
+try:
+    import uvloop
+except ImportError:  # uvloop isn't available on Windows; fall back to the default loop
+    uvloop = None
 
 # Add backend to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -17,6 +25,9 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from debug_system import run_full_system_test
 from agents.voice_agent import VoiceAgent
 
+# Readiness probes (0.1s apart) before giving up on the backend answering /health
+BACKEND_READY_ATTEMPTS = 300
+
 class SystemManager:
     """Manages the complete system startup and operation"""
     
@@ -24,6 +35,8 @@ class SystemManager:
         self.voice_agent = None
         self.running = False
         self.processes = []
+        self._stopped = asyncio.Event()  # wakes monitor_system as soon as shutdown starts
+        self._voice_task: Optional[asyncio.Task] = None  # completes when the agent's loop exits
         
     async def startup_sequence(self):
         """Execute complete system startup sequence"""
@@ -55,7 +68,7 @@ class SystemManager:
         print("\n📋 Step 3: Starting Voice Agent...")
         try:
             # Start voice agent in background task
-            asyncio.create_task(self.voice_agent.start())
+            self._voice_task = asyncio.create_task(self.voice_agent.start())
             print("✅ Voice Agent started successfully")
             print("🤖 Voice Agent is now processing leads...")
         except Exception as e:
@@ -79,27 +92,42 @@ class SystemManager:
         
         while self.running:
             try:
-                # Check voice agent status
-                if self.voice_agent and not self.voice_agent.running:
-                    print("⚠️  Voice Agent stopped - attempting restart...")
-                    try:
-                        await self.voice_agent.start()
-                        print("✅ Voice Agent restarted")
-                    except Exception as e:
-                        print(f"❌ Failed to restart Voice Agent: {e}")
+                # Sleep until the voice agent's task finishes or shutdown begins
+                stopped = asyncio.create_task(self._stopped.wait())
+                waiters = {stopped} | ({self._voice_task} if self._voice_task else set())
+                await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                stopped.cancel()
+                if not self.running:
+                    break
                 
-                # Wait before next check
-                await asyncio.sleep(60)  # Check every minute
+                # The agent's loop exited on its own (crash or stray stop) - restart it
+                task = self._voice_task
+                if task.cancelled() or task.exception() is None:
+                    print("⚠️  Voice Agent stopped - attempting restart...")
+                else:
+                    print(f"⚠️  Voice Agent crashed ({task.exception()}) - attempting restart...")
+                await self._wait_unless_stopped(5)  # Don't spin if it fails straight away
+                if self.running:
+                    self._voice_task = asyncio.create_task(self.voice_agent.start())
+                    print("✅ Voice Agent restarted")
                 
             except Exception as e:
                 print(f"❌ Error in system monitoring: {e}")
-                await asyncio.sleep(120)  # Wait longer on error
+                await self._wait_unless_stopped(120)  # Wait longer on error
+    
+    async def _wait_unless_stopped(self, seconds: float):
+        """Sleep up to `seconds`, returning early once shutdown begins"""
+        try:
+            await asyncio.wait_for(self._stopped.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
     
     async def shutdown_sequence(self):
         """Execute graceful system shutdown"""
         print("\n🛑 Starting system shutdown...")
         
         self.running = False
+        self._stopped.set()
         
         # Stop voice agent
         if self.voice_agent:
@@ -108,10 +136,12 @@ class SystemManager:
             
             # Show final statistics
             stats = self.voice_agent.get_statistics()
-            print(f"📊 Final Voice Agent Statistics:")
-            print(f"   Total attempts: {stats.get('total_attempts', 0)}")
-            print(f"   Successful calls: {stats.get('successful_vapi_calls', 0)}")
-            print(f"   Success rate: {stats.get('success_rate', 0):.1f}%")
+            print(
+                f"📊 Final Voice Agent Statistics:\n"
+                f"   Total attempts: {stats['total_attempts']}\n"
+                f"   Successful calls: {stats['successful_vapi_calls']}\n"
+                f"   Success rate: {stats['success_rate']:.1f}%"
+            )
         
         # Stop any other processes
         for process in self.processes:
@@ -138,25 +168,38 @@ async def start_backend_server():
     print("🌐 Starting FastAPI backend server...")
     
     try:
-        # Start FastAPI server using uvicorn
-        process = subprocess.Popen([
+        # Start FastAPI server using uvicorn; the reload watcher is for development only
+        args = [
             sys.executable, "-m", "uvicorn",
             "app:app",
             "--host", "0.0.0.0",
-            "--port", "8000",
-            "--reload"
-        ], cwd=os.path.dirname(os.path.abspath(__file__)))
+            "--port", "8000"
+        ]
+        if os.getenv("ENVIRONMENT", "development") == "development":
+            args.append("--reload")
+        else:
+            # Each worker runs its own agents, so WEB_CONCURRENCY stays 1 unless they run separately
+            args += ["--workers", os.getenv("WEB_CONCURRENCY", "1")]
+        process = subprocess.Popen(args, cwd=os.path.dirname(os.path.abspath(__file__)))
         
-        # Give server time to start
-        await asyncio.sleep(3)
+        # Poll /health until the server answers, rather than guessing a boot time
+        async with httpx.AsyncClient(timeout=0.5) as client:
+            for _ in range(BACKEND_READY_ATTEMPTS):
+                if process.poll() is not None:
+                    print("❌ FastAPI backend server failed to start")
+                    return None
+                try:
+                    response = await client.get("http://127.0.0.1:8000/health")
+                    if response.status_code < 500:
+                        print("✅ FastAPI backend server started on http://0.0.0.0:8000")
+                        return process
+                except httpx.RequestError:
+                    pass
+                await asyncio.sleep(0.1)
         
-        # Check if process is still running
-        if process.poll() is None:
-            print("✅ FastAPI backend server started on http://0.0.0.0:8000")
-            return process
-        else:
-            print("❌ FastAPI backend server failed to start")
-            return None
+        # Still running but not answering; keep it and let the health endpoints report
+        print("⚠️  FastAPI backend server is running but not answering /health yet")
+        return process
             
     except Exception as e:
         print(f"❌ Error starting backend server: {e}")
@@ -169,17 +212,21 @@ async def main():
     
     try:
         # Option to run with or without web server
-        run_server = input("Start FastAPI backend server? (y/n): ").lower().strip()
+        run_server = (await asyncio.to_thread(input, "Start FastAPI backend server? (y/n): ")).lower().strip()
         
-        backend_process = None
+        # Boot the server in the background while the startup sequence runs
+        backend_task = None
         if run_server in ['y', 'yes']:
-            backend_process = await start_backend_server()
-            if backend_process:
-                system_manager.processes.append(backend_process)
+            backend_task = asyncio.create_task(start_backend_server())
         
         # Execute startup sequence
         startup_success = await system_manager.startup_sequence()
         
+        # Register the server before any early return so shutdown terminates it
+        backend_process = await backend_task if backend_task else None
+        if backend_process:
+            system_manager.processes.append(backend_process)
+        
         if not startup_success:
             print("\n❌ System startup failed!")
             return
@@ -217,6 +264,9 @@ if __name__ == "__main__":
     
     print(f"\n⚙️  Environment: {os.getenv('ENVIRONMENT', 'development')}")
     
+    if uvloop is not None:
+        uvloop.install()
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -6,7 +6,7 @@ This script tests if Arizona phone numbers are correctly identified and time val
 import asyncio
 import sys
 import os
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Add backend to path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -34,6 +34,9 @@ async def test_arizona_timezone():
     
     print("🔍 Testing Arizona phone numbers:")
     
+    # One reference instant for every number's local-time printout
+    utc_now = datetime.now(timezone.utc)
+    
     for phone in arizona_phones:
         print(f"\n📱 Testing phone: {phone}")
         
@@ -42,25 +45,18 @@ async def test_arizona_timezone():
         print(f"   Formatted: {formatted}")
         
         # Test timezone detection and call time validation
-        is_valid = await vapi_service.is_valid_call_time(phone)
+        is_valid = vapi_service.is_valid_call_time(phone)
         print(f"   Valid call time: {is_valid}")
         
-        # Show current time in Arizona
-        import pytz
-        from datetime import timezone
-        
-        # Get area code
-        phone_digits = ''.join(filter(str.isdigit, phone))
-        if len(phone_digits) >= 10:
-            area_code = phone_digits[-10:-7]
-            print(f"   Area code: {area_code}")
+        # Show the zone the service resolved and the current time there
+        tz_info = vapi_service.get_phone_timezone(phone)
+        if tz_info is not None:
+            print(f"   Area code: {tz_info['area_code']}")
+            print(f"   Detected timezone: {tz_info['timezone']}")
             
-            # Get Arizona time
-            az_tz = pytz.timezone('US/Arizona')
-            utc_now = datetime.now(timezone.utc)
-            az_time = utc_now.astimezone(az_tz)
-            print(f"   Current Arizona time: {az_time.strftime('%I:%M %p %Z (%z)')}")
-            print(f"   Hour: {az_time.hour} (valid range: 8-20)")
+            local_time = utc_now.astimezone(tz_info["tzinfo"])
+            print(f"   Current local time: {local_time.strftime('%I:%M %p %Z (%z)')}")
+            print(f"   Hour: {local_time.hour} (valid range: {VAPIService.CALL_HOUR_MIN}-{VAPIService.CALL_HOUR_MAX - 1})")
 
     # Test non-Arizona numbers for comparison
     print("\n🔍 Testing non-Arizona phone numbers for comparison:")
@@ -74,7 +70,7 @@ async def test_arizona_timezone():
     
     for phone in other_phones:
         print(f"\n📱 Testing phone: {phone}")
-        is_valid = await vapi_service.is_valid_call_time(phone)
+        is_valid = vapi_service.is_valid_call_time(phone)
         print(f"   Valid call time: {is_valid}")
 
 if __name__ == "__main__":
@@ -5,21 +5,33 @@ This module sets up the Python path correctly so that imports from both
 'database' and 'backend.database' styles will work.
 """
 
-import os
 import sys
 import asyncio
+import importlib
+import signal
 from loguru import logger
 
+try:
+    import uvloop
+except ImportError:  # uvloop isn't available on Windows; fall back to the default loop
+    uvloop = None
+
 # Set up paths properly
-current_dir = os.getcwd()
-backend_dir = os.path.join(current_dir, 'backend')
+import _bootstrap
 
-# Add paths to sys.path if not already there
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
+# Agent modules run_agents needs; importing them builds the services (SQLAlchemy, httpx)
+AGENT_MODULES = ("backend.agents.voice_agent", "backend.agents.data_entry_agent")
 
-if backend_dir not in sys.path:
-    sys.path.insert(0, backend_dir)
+def preload_agent_modules():
+    """Import the agent modules one after another before the event loop starts"""
+    # Both share the database/services packages, so importing them in parallel would
+    # race on partially initialized modules for no gain under the GIL
+    for name in AGENT_MODULES:
+        try:
+            importlib.import_module(name)
+        except Exception as e:
+            # run_agents retries the import and reports the failure in context
+            logger.warning(f"Preloading {name} failed: {e}")
 
 async def run_agents():
     """Run both agents with proper path setup"""
@@ -47,10 +59,18 @@ async def run_agents():
         logger.info(f"Voice agent running: {voice_agent.running}")
         logger.info(f"Data entry agent running: {data_entry_agent.running}")
         
-        # Keep running until interrupted
+        # Keep running until SIGINT/SIGTERM sets the stop event
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:  # Windows: Ctrl+C still raises KeyboardInterrupt
+                pass
+        
         try:
-            while True:
-                await asyncio.sleep(10)
+            await stop.wait()
+            logger.info("Shutdown signal received")
         except KeyboardInterrupt:
             logger.info("Keyboard interrupt detected")
         finally:
@@ -72,6 +92,11 @@ if __name__ == "__main__":
     logger.remove()
     logger.add(sys.stderr, level="DEBUG")
     
+    preload_agent_modules()
+    
+    if uvloop is not None:
+        uvloop.install()
+    
     # Run the agents
     try:
         asyncio.run(run_agents())
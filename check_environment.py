@@ -2,6 +2,7 @@ import sys
 import os
 import importlib
 import json
+from collections import defaultdict
 
 def check_module(module_name):
     """Try to import a module and return result"""
@@ -13,52 +14,67 @@ def check_module(module_name):
     except Exception as e:
         return {"status": "error", "message": f"Unexpected error: {str(e)}"}
 
-def check_file_exists(path):
-    """Check if a file exists"""
-    exists = os.path.isfile(path)
-    return {"exists": exists, "path": path, "abs_path": os.path.abspath(path) if exists else None}
+def check_files_exist(paths):
+    """Check which files exist, listing each directory once instead of stat-ing every path"""
+    by_dir = defaultdict(list)
+    for path in paths:
+        by_dir[os.path.dirname(path) or "."].append(path)
+    
+    present = set()
+    for dir_path, dir_paths in by_dir.items():
+        try:
+            with os.scandir(dir_path) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except OSError:
+            continue
+        present.update(path for path in dir_paths if os.path.basename(path) in names)
+    
+    return {
+        path: {"exists": path in present, "path": path, "abs_path": os.path.abspath(path) if path in present else None}
+        for path in paths
+    }
+
+# Modules and files the report checks, in report order
+MODULES = [
+    "playwright", "playwright.async_api", "loguru", "sqlalchemy",
+    "database", "database.database", "database.models",
+    "backend.database", "backend.database.database",
+    "services", "services.leadhoop_service",
+    "backend.services", "backend.services.leadhoop_service"
+]
+FILES = [
+    "backend/agents/data_entry_agent.py",
+    "backend/agents/voice_agent.py",
+    "backend/database/database.py",
+    "backend/database/models.py",
+    "backend/services/leadhoop_service.py",
+    "backend/main.py"
+]
 
 def main():
     """Check environment and report"""
+    # Import one at a time: the list shares packages, and parallel imports race on
+    # partially initialized modules for no gain under the GIL
+    modules = {module_name: check_module(module_name) for module_name in MODULES}
+    
     results = {
         "python_version": sys.version,
         "python_path": sys.executable,
         "sys_path": sys.path,
         "cwd": os.getcwd(),
-        "modules": {
-            "playwright": check_module("playwright"),
-            "playwright.async_api": check_module("playwright.async_api"),
-            "loguru": check_module("loguru"),
-            "sqlalchemy": check_module("sqlalchemy"),
-            "database": check_module("database"),
-            "database.database": check_module("database.database"),
-            "database.models": check_module("database.models"),
-            "backend.database": check_module("backend.database"),
-            "backend.database.database": check_module("backend.database.database"),
-            "services": check_module("services"),
-            "services.leadhoop_service": check_module("services.leadhoop_service"),
-            "backend.services": check_module("backend.services"),
-            "backend.services.leadhoop_service": check_module("backend.services.leadhoop_service")
-        },
-        "files": {
-            "backend/agents/data_entry_agent.py": check_file_exists("backend/agents/data_entry_agent.py"),
-            "backend/agents/voice_agent.py": check_file_exists("backend/agents/voice_agent.py"),
-            "backend/database/database.py": check_file_exists("backend/database/database.py"),
-            "backend/database/models.py": check_file_exists("backend/database/models.py"),
-            "backend/services/leadhoop_service.py": check_file_exists("backend/services/leadhoop_service.py"),
-            "backend/main.py": check_file_exists("backend/main.py")
-        }
+        "modules": modules,
+        "files": check_files_exist(FILES)
     }
     
     # Add test for __init__.py files
-    init_files = {}
-    for dir_path in ["backend", "backend/agents", "backend/database", "backend/services"]:
-        init_path = os.path.join(dir_path, "__init__.py")
-        init_files[init_path] = check_file_exists(init_path)
-    results["init_files"] = init_files
+    results["init_files"] = check_files_exist([
+        os.path.join(dir_path, "__init__.py")
+        for dir_path in ["backend", "backend/agents", "backend/database", "backend/services"]
+    ])
     
-    # Print results nicely formatted
-    print(json.dumps(results, indent=2))
+    # Print results nicely formatted, streamed to stdout rather than built as one string
+    json.dump(results, sys.stdout, indent=2)
+    print()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
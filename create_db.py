@@ -1,48 +1,79 @@
 import os
-from dotenv import load_dotenv
+import re
+import sys
+import argparse
 from sqlalchemy import create_engine, text
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.pool import NullPool
 import getpass
+from env_files import load_env_once
 
-# Load environment variables
-load_dotenv()
+# Load environment variables so PG* settings in .env reach the flag defaults
+load_env_once()
 
-def create_database():
-    # Prompt for database credentials
-    print("Please enter your PostgreSQL credentials:")
-    username = input("Username (default: postgres): ") or "postgres"
-    password = getpass.getpass("Password: ")
-    host = input("Host (default: localhost): ") or "localhost"
-    port = input("Port (default: 5432): ") or "5432"
+# Database names CREATE DATABASE accepts here; it cannot take a bound parameter
+_DB_NAME_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+def parse_args(argv=None):
+    """Read credentials from flags, falling back to the libpq PG* variables (environment or .env)"""
+    parser = argparse.ArgumentParser(description="Create the MERGE AI workflow database")
+    parser.add_argument("--username", default=os.getenv("PGUSER"), help="defaults to PGUSER")
+    parser.add_argument("--password", default=os.getenv("PGPASSWORD"), help="defaults to PGPASSWORD")
+    parser.add_argument("--host", default=os.getenv("PGHOST"), help="defaults to PGHOST")
+    parser.add_argument("--port", default=os.getenv("PGPORT"), help="defaults to PGPORT")
+    parser.add_argument("--dbname", default="merge_ai_workflow")
+    return parser.parse_args(argv)
+
+def create_database(args=None):
+    args = args or parse_args([])
+    
+    # Prompt only for credentials not given, and only when someone is at the terminal
+    interactive = sys.stdin.isatty()
+    if interactive and None in (args.username, args.password, args.host, args.port):
+        print("Please enter your PostgreSQL credentials:")
+    username = args.username or (interactive and input("Username (default: postgres): ")) or "postgres"
+    password = args.password if args.password is not None else (getpass.getpass("Password: ") if interactive else "")
+    host = args.host or (interactive and input("Host (default: localhost): ")) or "localhost"
+    port = args.port or (interactive and input("Port (default: 5432): ")) or "5432"
     
     # Connect to the default postgres database
     DATABASE_URL = f"postgresql://{username}:{password}@{host}:{port}/postgres"
-    TARGET_DB = "merge_ai_workflow"
+    TARGET_DB = args.dbname
+    if not _DB_NAME_RE.match(TARGET_DB):
+        print(f"Invalid database name: {TARGET_DB!r}")
+        return
     
     try:
-        # Create a connection
-        engine = create_engine(DATABASE_URL)
+        # Create a connection; this one-off admin connection needs no pool, and
+        # autocommit lets CREATE DATABASE run outside a transaction
+        engine = create_engine(DATABASE_URL, poolclass=NullPool, isolation_level="AUTOCOMMIT")
         with engine.connect() as conn:
-            # Commit any open transaction
-            conn.execute(text("COMMIT"))
-            
             # Check if the target database already exists
-            result = conn.execute(text(f"SELECT 1 FROM pg_database WHERE datname = '{TARGET_DB}'"))
+            result = conn.execute(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": TARGET_DB}
+            )
             if result.fetchone():
                 print(f"Database '{TARGET_DB}' already exists.")
                 return
             
             # Create the database
-            conn.execute(text(f"CREATE DATABASE {TARGET_DB}"))
+            conn.execute(text(f"CREATE DATABASE {conn.dialect.identifier_preparer.quote(TARGET_DB)}"))
             print(f"Database '{TARGET_DB}' created successfully!")
             
-            # Save connection string to .env.local
+            # Save connection string to .env.local, replacing it in one step so a
+            # crash never leaves a half-written file for setup_db.py to load
             conn_string = f"postgresql://{username}:{password}@{host}:{port}/{TARGET_DB}"
-            with open(".env.local", "w") as f:
-                f.write(f"DATABASE_URL={conn_string}\n")
-                f.write("SECRET_KEY=develop_key_12345\n")
-                f.write("DEBUG=True\n")
-                f.write("LOG_LEVEL=INFO\n")
+            env_local = "\n".join([
+                f"DATABASE_URL={conn_string}",
+                "SECRET_KEY=develop_key_12345",
+                "DEBUG=True",
+                "LOG_LEVEL=INFO",
+                ""
+            ])
+            with open(".env.local.tmp", "w", encoding="utf-8", newline="\n") as f:
+                f.write(env_local)
+            os.replace(".env.local.tmp", ".env.local")
             print("Connection details saved to .env.local")
     
     except OperationalError as e:
@@ -52,4 +83,4 @@ def create_database():
         print(f"An error occurred: {e}")
 
 if __name__ == "__main__":
-    create_database() 
\ No newline at end of file
+    create_database(parse_args()) 
\ No newline at end of file
@@ -1,21 +1,25 @@
 import asyncio
 import sys
-import os
 from loguru import logger
 
 # Configure logger to output to console
 logger.remove()
 logger.add(sys.stderr, level="DEBUG")
 
-# Use the path to make imports work
-current_dir = os.getcwd()
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
-
 # This is needed to make the imports work from both locations
-backend_dir = os.path.join(current_dir, 'backend')
-if backend_dir not in sys.path:
-    sys.path.insert(0, backend_dir)
+import _bootstrap
+
+async def wait_until_ready(agent, timeout: float = 5):
+    """Wait for the agent's ready event instead of a fixed sleep"""
+    try:
+        await asyncio.wait_for(agent.ready.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"{agent.__class__.__name__} not ready after {timeout}s")
+
+async def stop_task(task):
+    """Cancel an agent loop that is sleeping between checks and wait for it to finish"""
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
 
 async def test_voice_agent():
     """Test only voice agent"""
@@ -30,11 +34,11 @@ async def test_voice_agent():
     
     try:
         voice_task = asyncio.create_task(voice_agent.start())
-        await asyncio.sleep(5)
+        await wait_until_ready(voice_agent)
         voice_running = voice_agent.running
         logger.info(f"Voice agent running: {voice_running}")
         voice_agent.stop()
-        await asyncio.sleep(2)
+        await stop_task(voice_task)
     except Exception as e:
         voice_error = str(e)
         logger.error(f"Voice agent error: {e}")
@@ -58,11 +62,11 @@ async def test_data_entry_agent():
     try:
         data_entry_agent = DataEntryAgent()
         data_entry_task = asyncio.create_task(data_entry_agent.start())
-        await asyncio.sleep(5)
+        await wait_until_ready(data_entry_agent)
         data_entry_running = data_entry_agent.running
         logger.info(f"Data entry agent running: {data_entry_running}")
         data_entry_agent.stop()
-        await asyncio.sleep(2)
+        await stop_task(data_entry_task)
     except Exception as e:
         data_entry_error = str(e)
         logger.error(f"Data entry agent error: {e}")
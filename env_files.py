@@ -0,0 +1,21 @@
+"""
+Env File Loader
+
+Loads .env and .env.local once per process for the root-level setup scripts.
+"""
+
+import os
+from dotenv import dotenv_values
+
+_ENV_LOADED = False
+
+def load_env_once():
+    """Load .env and .env.local in one pass; real environment variables win, then .env"""
+    global _ENV_LOADED
+    if _ENV_LOADED:
+        return
+    values = {**dotenv_values(".env.local"), **dotenv_values(".env")}
+    for key, value in values.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    _ENV_LOADED = True
@@ -2,31 +2,31 @@
 import os
 import sys
 import uvicorn
+import atexit
 import logging
+import logging.handlers
+import queue
 import traceback
 
-# Configure logging
+# Configure logging. Records are formatted once by the QueueHandler and written
+# by a listener thread, so the app.log write never blocks the caller; the file
+# is opened on first write, not at import (reload workers re-run this module).
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    log_queue,
+    logging.StreamHandler(),
+    logging.FileHandler("app.log", delay=True)
+)
+log_listener.start()
+atexit.register(log_listener.stop)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("app.log")
-    ]
+    handlers=[logging.handlers.QueueHandler(log_queue)]
 )
 
 # Set up paths properly
-current_dir = os.path.dirname(os.path.abspath(__file__))
-backend_dir = os.path.join(current_dir, 'backend')
-
-# Add paths to sys.path if not already there
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
-    logging.info(f"Added {current_dir} to sys.path")
-
-if backend_dir not in sys.path:
-    sys.path.insert(0, backend_dir)
-    logging.info(f"Added {backend_dir} to sys.path")
+from _bootstrap import BACKEND_DIR
 
 logging.info(f"Python version: {sys.version}")
 logging.info(f"Current directory: {os.getcwd()}")
@@ -49,13 +49,16 @@ if __name__ == "__main__":
             logging.error(f"Error loading data entry agent: {agent_error}")
             traceback.print_exc()
         
-        # Start the FastAPI application with Uvicorn
+        # Start the FastAPI application with Uvicorn; only development reloads, and
+        # the watcher is limited to backend/ so frontend changes don't re-import it
+        reload = os.getenv("ENVIRONMENT", "development") == "development"
         logging.info("Starting FastAPI application with Uvicorn")
         uvicorn.run(
             "backend.main:app", 
             host="0.0.0.0", 
             port=8000, 
-            reload=True,
+            reload=reload,
+            reload_dirs=[BACKEND_DIR] if reload else None,
             log_level="debug"
         )
     except ImportError as e:
@@ -1,6 +1,5 @@
 import asyncio
 import sys
-import os
 import traceback
 from loguru import logger
 
@@ -9,13 +8,7 @@ logger.remove()
 logger.add(sys.stderr, level="DEBUG")
 
 # Set up paths for imports
-current_dir = os.getcwd()
-if current_dir not in sys.path:
-    sys.path.insert(0, current_dir)
-
-backend_dir = os.path.join(current_dir, 'backend')
-if backend_dir not in sys.path:
-    sys.path.insert(0, backend_dir)
+import _bootstrap
 
 async def test_data_entry_agent():
     """Test only the data entry agent with detailed error reporting"""
@@ -64,8 +57,11 @@ async def test_data_entry_agent():
         logger.info("Starting data entry agent")
         task = asyncio.create_task(data_entry_agent.start())
         
-        # Wait for a short time to see if it starts successfully
-        await asyncio.sleep(10)
+        # Wait for the agent to signal that it started
+        try:
+            await asyncio.wait_for(data_entry_agent.ready.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            logger.warning("Data entry agent not ready after 10s")
         
         # Check if the agent is running
         is_running = data_entry_agent.running
@@ -75,11 +71,12 @@ async def test_data_entry_agent():
         logger.info("Stopping data entry agent")
         data_entry_agent.stop()
         
-        # Wait for cleanup
-        await asyncio.sleep(5)
+        # The loop may be sleeping between checks; cancel it and wait for cleanup
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
         
         # Check for any exceptions in the task
-        if task.done():
+        if not task.cancelled():
             if task.exception():
                 logger.error(f"Task exception: {task.exception()}")
                 logger.error(traceback.format_exception(type(task.exception()), task.exception(), task.exception().__traceback__))